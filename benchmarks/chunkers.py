@@ -0,0 +1,413 @@
+"""
+Benchmark and golden output check of the text chunkers.
+
+Chunkers are run on deterministic synthetic corpora shaped like real-world inputs (short FAQ entries,
+long PDF-like documents, source code, Markdown and CJK text), reporting docs/sec, tokens/sec and peak
+memory. Golden outputs (a hash of the chunks of each chunker and corpus, keyed by tokenizer encoding)
+verify that performance work does not change chunk output. The check fails on missing golden outputs.
+
+Golden outputs of the offline byte-level `pineflow-bytes` encoding are committed in `golden/chunkers.json`,
+so they can be checked without downloading a tiktoken encoding.
+
+Usage:
+    python benchmarks/chunkers.py                     # run the benchmarks
+    python benchmarks/chunkers.py --encoding pineflow-bytes --golden benchmarks/golden/chunkers.json
+    python benchmarks/chunkers.py --golden benchmarks/golden/chunkers.json --update  # record golden outputs
+
+Requires `pineflow-core`, and the `cl100k_base` tiktoken encoding unless another one is given with `--encoding`.
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import numpy as np
+import tiktoken
+from pineflow.core.document import Document
+from pineflow.core.embeddings import BaseEmbedding
+from pineflow.core.text_chunkers import (
+    MarkdownChunker,
+    SemanticChunker,
+    SentenceChunker,
+    TokenTextChunker,
+)
+from pineflow.core.text_chunkers.utils import (
+    DEFAULT_ENCODING,
+    count_tokens,
+    merge_splits,
+)
+
+BYTES_ENCODING = "pineflow-bytes"
+
+_WORDS = [
+    "data", "pipeline", "vector", "store", "embedding", "model", "retrieval", "document",
+    "chunk", "token", "sentence", "query", "index", "search", "answer", "context", "language",
+    "large", "memory", "cache", "batch", "stream", "parallel", "process", "worker", "flow",
+    "reader", "metadata", "offset", "score", "threshold", "semantic", "overlap", "window",
+]  # fmt: skip
+
+_CJK_CHARS = "数据管道向量存储嵌入模型检索文档分块标记句子查询索引搜索答案上下文语言内存缓存批处理流并行进程"
+
+
+def _document(text: str, source: str) -> Document:
+    # Fixed IDs, as chunk IDs are derived from them
+    return Document(id_=source, text=text, metadata={"source": source})
+
+
+def _sentence(rng: random.Random, min_words: int = 5, max_words: int = 25) -> str:
+    words = rng.choices(_WORDS, k=rng.randint(min_words, max_words))
+    return " ".join(words).capitalize() + rng.choice([".", ".", ".", "?", "!"])
+
+
+def _paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def faq_corpus(rng: random.Random) -> List[Document]:
+    """Many short question and answer documents."""
+    return [
+        _document(
+            f"Q: {_sentence(rng, 5, 12)[:-1]}?\nA: {_paragraph(rng, rng.randint(1, 4))}",
+            f"faq-{i}",
+        )
+        for i in range(2000)
+    ]
+
+
+def pdf_corpus(rng: random.Random) -> List[Document]:
+    """Few long documents of pages of paragraphs, with hyphenated line breaks."""
+    documents = []
+
+    for i in range(20):
+        pages = []
+        for _ in range(30):
+            paragraphs = [
+                _paragraph(rng, rng.randint(3, 10)) for _ in range(rng.randint(2, 6))
+            ]
+            pages.append("\n\n".join(paragraphs).replace("ing ", "ing-\n", 3))
+        documents.append(_document("\n\n\n".join(pages), f"pdf-{i}"))
+
+    return documents
+
+
+def code_corpus(rng: random.Random) -> List[Document]:
+    """Python-like source files."""
+    documents = []
+
+    for i in range(100):
+        functions = []
+        for j in range(rng.randint(5, 30)):
+            args = ", ".join(rng.sample(_WORDS, rng.randint(0, 4)))
+            body = "\n".join(
+                f"    {rng.choice(_WORDS)}_{k} = {rng.choice(_WORDS)}({args})"
+                for k in range(rng.randint(2, 15))
+            )
+            functions.append(
+                f'def {rng.choice(_WORDS)}_{j}({args}):\n    """{_sentence(rng)}"""\n{body}\n'
+            )
+        documents.append(_document("\n\n".join(functions), f"code-{i}.py"))
+
+    return documents
+
+
+def markdown_corpus(rng: random.Random) -> List[Document]:
+    """Markdown documents with sections, code blocks and tables."""
+    documents = []
+
+    for i in range(100):
+        blocks = [f"# {_sentence(rng, 2, 5)[:-1]}"]
+        for j in range(rng.randint(3, 10)):
+            blocks.append(f"## Section {j}")
+            blocks.extend(
+                _paragraph(rng, rng.randint(2, 8)) for _ in range(rng.randint(1, 4))
+            )
+            if rng.random() < 0.3:
+                blocks.append(f"```python\nprint({rng.choice(_WORDS)!r})\n```")
+            if rng.random() < 0.3:
+                rows = [
+                    f"| {rng.choice(_WORDS)} | {rng.randint(0, 100)} |"
+                    for _ in range(rng.randint(2, 10))
+                ]
+                blocks.append("| name | value |\n|---|---|\n" + "\n".join(rows))
+        documents.append(_document("\n\n".join(blocks), f"doc-{i}.md"))
+
+    return documents
+
+
+def cjk_corpus(rng: random.Random) -> List[Document]:
+    """Chinese text, with no spaces between words."""
+    return [
+        _document(
+            "\n\n".join(
+                "".join(
+                    "".join(rng.choices(_CJK_CHARS, k=rng.randint(8, 40)))
+                    + rng.choice("。。，！？")
+                    for _ in range(rng.randint(3, 12))
+                )
+                for _ in range(rng.randint(5, 40))
+            ),
+            f"cjk-{i}",
+        )
+        for i in range(100)
+    ]
+
+
+def register_bytes_encoding() -> None:
+    """Register the `pineflow-bytes` encoding: one token per byte, after GPT-like pre-tokenization."""
+    tiktoken.registry.ENCODINGS[BYTES_ENCODING] = tiktoken.Encoding(
+        name=BYTES_ENCODING,
+        pat_str=r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+""",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+
+
+CORPORA: Dict[str, Callable[[random.Random], List[Document]]] = {
+    "faq": faq_corpus,
+    "pdf": pdf_corpus,
+    "code": code_corpus,
+    "markdown": markdown_corpus,
+    "cjk": cjk_corpus,
+}
+
+
+class HashingEmbedding(BaseEmbedding):
+    """Deterministic bag-of-words embedding, so `SemanticChunker` is benchmarked without a model."""
+
+    dimensions: int = 256
+
+    def get_text_embedding(self, query: str) -> List[float]:
+        return self.get_texts_embedding([query])[0]
+
+    def get_texts_embedding(self, texts: List[str]) -> List[List[float]]:
+        embeddings = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+
+        for i, text in enumerate(texts):
+            for word in text.split():
+                digest = hashlib.blake2b(word.encode(), digest_size=4).digest()
+                embeddings[i, int.from_bytes(digest, "little") % self.dimensions] += 1
+
+        return embeddings.tolist()
+
+    def get_documents_embedding(self, documents: List[Document]) -> List[Document]:
+        for document, embedding in zip(
+            documents,
+            self.get_texts_embedding(
+                [document.get_content() for document in documents]
+            ),
+        ):
+            document.embedding = embedding
+
+        return documents
+
+
+CHUNKERS: Dict[str, Callable[[str], object]] = {
+    "token": lambda encoding: TokenTextChunker(encoding_name=encoding),
+    "token_window": lambda encoding: TokenTextChunker(
+        encoding_name=encoding, token_window=True
+    ),
+    "sentence": lambda encoding: SentenceChunker(encoding_name=encoding),
+    "sentence_regex": lambda encoding: SentenceChunker(
+        encoding_name=encoding, sentence_backend="regex"
+    ),
+    "sentence_offsets": lambda encoding: SentenceChunker(
+        encoding_name=encoding, include_offsets=True
+    ),
+    "markdown": lambda encoding: MarkdownChunker(encoding_name=encoding),
+    "semantic": lambda encoding: SemanticChunker(
+        embed_model=HashingEmbedding(), encoding_name=encoding
+    ),
+    "semantic_bounded": lambda encoding: SemanticChunker(
+        embed_model=HashingEmbedding(),
+        encoding_name=encoding,
+        breakpoint_threshold_type="interquartile",
+        max_chunk_tokens=512,
+        min_chunk_tokens=32,
+    ),
+}
+
+
+def chunks_digest(chunks: List[Document]) -> str:
+    """Hash of the text, ID and metadata of the chunks, in order."""
+    digest = hashlib.sha256()
+
+    for chunk in chunks:
+        digest.update(chunk.id_.encode())
+        digest.update(chunk.get_content().encode())
+        digest.update(json.dumps(chunk.get_metadata(), sort_keys=True).encode())
+
+    return digest.hexdigest()
+
+
+def run_chunker(
+    name: str,
+    corpus: str,
+    documents: List[Document],
+    repeat: int,
+    encoding: str = DEFAULT_ENCODING,
+) -> dict:
+    chunker = CHUNKERS[name](encoding)
+    tokens = sum(
+        count_tokens(document.get_content(), encoding) for document in documents
+    )
+
+    # Warm up tokenizer and sentence models, so they are not part of the timings
+    chunks = chunker.from_documents(documents[:1])
+
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        chunks = chunker.from_documents(documents)
+        timings.append(time.perf_counter() - start)
+
+    # Memory is traced in a separate run, tracing slows down allocations
+    gc.collect()
+    tracemalloc.start()
+    chunker.from_documents(documents)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    elapsed = min(timings)
+
+    return {
+        "chunker": name,
+        "corpus": corpus,
+        "documents": len(documents),
+        "chunks": len(chunks),
+        "seconds": elapsed,
+        "docs_per_sec": len(documents) / elapsed,
+        "tokens_per_sec": tokens / elapsed,
+        "peak_memory_mb": peak_memory / 2**20,
+        "digest": chunks_digest(chunks),
+    }
+
+
+def run_merge_splits(repeat: int) -> dict:
+    """Micro-benchmark of `merge_splits` on many small splits."""
+    rng = random.Random(0)
+    splits = [
+        {
+            "text": _sentence(rng) + " ",
+            "is_sentence": True,
+            "token_size": rng.randint(5, 40),
+        }
+        for _ in range(200_000)
+    ]
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = merge_splits(splits, 512, 128)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "chunker": "merge_splits",
+        "corpus": "splits",
+        "documents": len(splits),
+        "chunks": len(chunks),
+        "seconds": min(timings),
+        "docs_per_sec": len(splits) / min(timings),
+        "tokens_per_sec": sum(split["token_size"] for split in splits) / min(timings),
+        "peak_memory_mb": float("nan"),
+        "digest": hashlib.sha256("\0".join(chunks).encode()).hexdigest(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--chunkers", nargs="+", choices=list(CHUNKERS), default=list(CHUNKERS)
+    )
+    parser.add_argument(
+        "--corpora", nargs="+", choices=list(CORPORA), default=list(CORPORA)
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs, the fastest is reported."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed of the synthetic corpora."
+    )
+    parser.add_argument(
+        "--golden", help="JSON file of golden outputs to check against."
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="Write the golden outputs instead."
+    )
+    parser.add_argument(
+        "--encoding",
+        default=DEFAULT_ENCODING,
+        help=f"tiktoken encoding of the chunkers, `{BYTES_ENCODING}` works offline.",
+    )
+    parser.add_argument("--output", help="Write the results to a JSON file.")
+    args = parser.parse_args()
+
+    register_bytes_encoding()
+
+    results = [run_merge_splits(args.repeat)]
+    for corpus in args.corpora:
+        documents = CORPORA[corpus](random.Random(args.seed))
+        for name in args.chunkers:
+            results.append(
+                run_chunker(name, corpus, documents, args.repeat, args.encoding)
+            )
+
+    print(
+        f"{'chunker':<18} {'corpus':<10} {'docs':>7} {'chunks':>7} {'seconds':>8} "
+        f"{'docs/s':>10} {'tokens/s':>11} {'peak MB':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['chunker']:<18} {r['corpus']:<10} {r['documents']:>7} {r['chunks']:>7} "
+            f"{r['seconds']:>8.3f} {r['docs_per_sec']:>10.0f} {r['tokens_per_sec']:>11.0f} "
+            f"{r['peak_memory_mb']:>8.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if not args.golden:
+        return 0
+
+    digests = {
+        f"{args.encoding}/{r['chunker']}/{r['corpus']}/{args.seed}": r["digest"]
+        for r in results
+    }
+
+    if args.update:
+        try:
+            with open(args.golden) as f:
+                golden = json.load(f)
+        except FileNotFoundError:
+            golden = {}
+        golden.update(digests)
+        with open(args.golden, "w") as f:
+            json.dump(golden, f, indent=2, sort_keys=True)
+        print(f"Wrote {len(digests)} golden outputs to {args.golden}")
+        return 0
+
+    with open(args.golden) as f:
+        golden = json.load(f)
+
+    mismatches = [
+        key for key, digest in digests.items() if golden.get(key, digest) != digest
+    ]
+    missing = [key for key in digests if key not in golden]
+
+    for key in missing:
+        print(f"No golden output for {key}, record it with --update")
+    for key in mismatches:
+        print(f"Chunk output changed for {key}")
+
+    return 1 if mismatches or missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""
+Benchmark and regression check of the `IngestionFlow` de-duplication.
+
+De-duplication uses hash sets, so filtering documents against the hashes stored in the vector store is
+linear. This script runs it against an in-memory vector store of 1M stored hashes, for both document
+strategies, and compares it to the previous list-based implementation, kept below as a reference. The
+reference is quadratic, so it runs on a smaller store (`--reference-stored`), where both are checked to
+keep and delete the same documents.
+
+Usage:
+    python benchmarks/dedup.py
+    python benchmarks/dedup.py --stored 5000000 --documents 50000
+
+Requires `pineflow-core`.
+"""
+
+import argparse
+import hashlib
+import random
+import sys
+import time
+from typing import List, Set, Tuple
+
+from pineflow.core.document import Document
+from pineflow.core.flows import IngestionFlow
+from pineflow.core.flows.ingestion_flow import DocStrategy
+from pineflow.core.vector_stores import BaseVectorStore
+
+
+def _hash(text: str) -> str:
+    # Same as `Document.hash`
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class HashStore(BaseVectorStore):
+    """In-memory vector store of document hashes only, so the benchmark measures de-duplication alone."""
+
+    def __init__(self, size: int) -> None:
+        self.ids = [f"stored-{i}" for i in range(size)]
+        self.hashes = [_hash(f"stored document {i}") for i in range(size)]
+        self.ref_hashes = [None] * size
+        self.deleted_ids: List[str] = []
+
+    def add_documents(self, documents: List[Document]) -> List[str]:
+        return [doc.id_ for doc in documents]
+
+    def search_documents(self, query: str, top_k: int = 4) -> list:
+        return []
+
+    def delete_documents(self, ids: List[str]) -> None:
+        self.deleted_ids.extend(ids)
+
+    def get_all_documents(self, include_fields: List[str] = None) -> List[Document]:
+        raise NotImplementedError("Only hashes are stored.")
+
+    def get_all_document_hashes(self) -> Tuple[List[str], List[str], List[str]]:
+        return self.ids, self.hashes, self.ref_hashes
+
+    def exists_hashes(self, hashes: List[str], parent_level: bool = False) -> Set[str]:
+        stored = getattr(self, "_hash_set", None)
+        if stored is None:
+            # Built once, as a vector store index would be
+            stored = self._hash_set = set(self.hashes)
+
+        return stored.intersection(hashes)
+
+
+def reference_handle_duplicates(
+    flow: IngestionFlow, documents: List[Document]
+) -> List[Document]:
+    """Previous implementation of `IngestionFlow._handle_duplicates`, with list membership tests."""
+    ids, existing_hashes, existing_ref_hashes = (
+        flow.vector_store.get_all_document_hashes()
+    )
+
+    if flow.post_transformer:
+        hashes_fallback = existing_hashes
+    else:
+        hashes_fallback = [
+            existing_ref_hashes[i]
+            if existing_ref_hashes[i] is not None
+            else existing_hashes[i]
+            for i in range(len(existing_ref_hashes))
+        ]
+
+    current_hashes = []
+    current_unique_hashes = []
+    dedup_documents_to_run = []
+
+    for doc in documents:
+        current_hashes.append(doc.hash)
+
+        if (
+            doc.hash not in hashes_fallback
+            and doc.hash not in current_unique_hashes
+            and doc.get_content() != ""
+        ):
+            dedup_documents_to_run.append(doc)
+            current_unique_hashes.append(doc.hash)
+
+    if flow.doc_strategy == DocStrategy.DUPLICATE_AND_DELETE:
+        ids_to_remove = [
+            ids[i]
+            for i in range(len(hashes_fallback))
+            if hashes_fallback[i] not in current_hashes
+        ]
+        flow.vector_store.delete_documents(ids_to_remove)
+
+    return dedup_documents_to_run
+
+
+def input_documents(
+    stored: int, count: int, duplicate_ratio: float, seed: int
+) -> List[Document]:
+    """Documents of which `duplicate_ratio` are already stored, with a few repeated ones."""
+    rng = random.Random(seed)
+    documents = []
+
+    for i in range(count):
+        if rng.random() < duplicate_ratio:
+            text = f"stored document {rng.randrange(stored)}"
+        else:
+            text = f"new document {rng.randrange(count)}"
+        documents.append(Document(id_=f"input-{i}", text=text))
+
+    return documents
+
+
+def run(
+    stored: int,
+    documents: List[Document],
+    strategy: DocStrategy,
+    reference: bool = False,
+) -> dict:
+    store = HashStore(stored)
+    flow = IngestionFlow(
+        transformers=[],
+        vector_store=store,
+        doc_strategy=strategy,
+        post_transformer=True,
+    )
+
+    if strategy == DocStrategy.DUPLICATE_ONLY:
+        # Build the hash index outside of the timings
+        store.exists_hashes([])
+
+    start = time.perf_counter()
+    if reference:
+        kept = reference_handle_duplicates(flow, documents)
+    else:
+        kept = flow._handle_duplicates(documents, set())
+    elapsed = time.perf_counter() - start
+
+    return {
+        "strategy": strategy.value,
+        "implementation": "reference" if reference else "sets",
+        "stored": stored,
+        "documents": len(documents),
+        "kept": [doc.id_ for doc in kept],
+        "deleted": len(store.deleted_ids),
+        "seconds": elapsed,
+    }
+
+
+def time_filter_duplicates(stored: int, documents: List[Document]) -> float:
+    """Time `IngestionFlow._filter_duplicates` alone, against a set of `stored` hashes."""
+    existing_hashes = set(HashStore(stored).hashes)
+    flow = IngestionFlow(transformers=[])
+
+    start = time.perf_counter()
+    flow._filter_duplicates(documents, existing_hashes, set(), set())
+
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--stored", type=int, default=1_000_000, help="Number of stored hashes."
+    )
+    parser.add_argument(
+        "--documents", type=int, default=10_000, help="Number of input documents."
+    )
+    parser.add_argument(
+        "--duplicate-ratio",
+        type=float,
+        default=0.5,
+        help="Fraction of input documents already stored.",
+    )
+    parser.add_argument(
+        "--reference-stored",
+        type=int,
+        default=20_000,
+        help="Number of stored hashes for the comparison with the reference implementation.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    documents = input_documents(
+        args.stored, args.documents, args.duplicate_ratio, args.seed
+    )
+    print(
+        f"_filter_duplicates: {args.documents} documents against {args.stored} hashes in "
+        f"{time_filter_duplicates(args.stored, documents):.3f}s"
+    )
+
+    results = [
+        run(args.stored, documents, strategy)
+        for strategy in (DocStrategy.DUPLICATE_ONLY, DocStrategy.DUPLICATE_AND_DELETE)
+    ]
+
+    # The reference is quadratic, both implementations are compared on a smaller store
+    reference_documents = input_documents(
+        args.reference_stored, args.documents, args.duplicate_ratio, args.seed
+    )
+    mismatches = []
+
+    for strategy in (DocStrategy.DUPLICATE_ONLY, DocStrategy.DUPLICATE_AND_DELETE):
+        result = run(args.reference_stored, reference_documents, strategy)
+        expected = run(
+            args.reference_stored, reference_documents, strategy, reference=True
+        )
+        results.extend([result, expected])
+
+        if (result["kept"], result["deleted"]) != (
+            expected["kept"],
+            expected["deleted"],
+        ):
+            mismatches.append(strategy.value)
+
+    print(
+        f"\n{'strategy':<22} {'implementation':<15} {'stored':>9} {'documents':>9} "
+        f"{'kept':>7} {'deleted':>9} {'seconds':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['strategy']:<22} {r['implementation']:<15} {r['stored']:>9} "
+            f"{r['documents']:>9} {len(r['kept']):>7} {r['deleted']:>9} {r['seconds']:>8.3f}"
+        )
+
+    for strategy in mismatches:
+        print(f"De-duplication output changed for {strategy}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+Regression check and benchmark of `merge_splits`.
+
+`merge_splits` was made linear in the number of splits. This script checks that it returns the same chunks
+as the previous quadratic implementation, kept below as a reference, on randomized splits and on the splits
+of the text chunkers. It then times both implementations on growing numbers of splits, and the chunkers on
+a single large (10 MB by default) document.
+
+Usage:
+    python benchmarks/merge_splits.py
+    python benchmarks/merge_splits.py --cases 20000 --document-mb 50
+
+Requires `pineflow-core` and the `cl100k_base` tiktoken encoding, or the encoding given with `--encoding`.
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import List, Tuple
+
+from pineflow.core.text_chunkers import SentenceChunker, TokenTextChunker
+from pineflow.core.text_chunkers.utils import DEFAULT_ENCODING, merge_splits
+
+_WORDS = [
+    "data", "pipeline", "vector", "store", "embedding", "model", "retrieval", "document",
+    "chunk", "token", "sentence", "query", "index", "search", "answer", "context",
+]  # fmt: skip
+
+_SPLIT_TEXTS = ["a", "bb", " ", "c d", "\n", "x.", "  ", "\n\n", "Pineflow. "]
+
+
+def reference_merge_splits(
+    splits: List[dict], chunk_size: int, chunk_overlap: int
+) -> List[str]:
+    """
+    Previous implementation of `merge_splits`, quadratic in the number of splits.
+
+    Splits are consumed with `splits.pop(0)` and the overlap is rebuilt with `cur_chunk.insert(0, ...)`.
+    """
+    splits = list(splits)
+    chunks: List[str] = []
+    cur_chunk: List[Tuple[str, int]] = []
+    cur_chunk_len = 0
+    last_chunk: List[Tuple[str, int]] = []
+    new_chunk = True
+
+    def close_chunk() -> None:
+        nonlocal chunks, cur_chunk, last_chunk, cur_chunk_len, new_chunk
+
+        chunks.append("".join([text for text, length in cur_chunk]))
+        last_chunk = cur_chunk
+        cur_chunk = []
+        cur_chunk_len = 0
+        new_chunk = True
+
+        # add overlap to the next chunk using previous chunk
+        if len(last_chunk) > 0:
+            last_index = len(last_chunk) - 1
+            while (
+                last_index >= 0
+                and cur_chunk_len + last_chunk[last_index][1] <= chunk_overlap
+            ):
+                text, length = last_chunk[last_index]
+                cur_chunk_len += length
+                cur_chunk.insert(0, (text, length))
+                last_index -= 1
+
+    while len(splits) > 0:
+        cur_split = splits[0]
+
+        if cur_split["token_size"] > chunk_size:
+            raise ValueError("Got a split size that exceeded chunk size")
+
+        if cur_chunk_len + cur_split["token_size"] > chunk_size and not new_chunk:
+            close_chunk()
+        else:
+            if (
+                cur_split["is_sentence"]
+                or cur_chunk_len + cur_split["token_size"] <= chunk_size
+                or new_chunk
+            ):  # If `new_chunk`, always add at least one split
+                cur_chunk_len += cur_split["token_size"]
+                cur_chunk.append((cur_split["text"], cur_split["token_size"]))
+                splits.pop(0)
+                new_chunk = False
+            else:
+                close_chunk()
+
+    if not new_chunk:
+        chunks.append("".join([text for text, length in cur_chunk]))
+
+    return [chunk.strip() for chunk in chunks if chunk.strip() != ""]
+
+
+def random_case(rng: random.Random) -> Tuple[List[dict], int, int]:
+    """Random splits, including empty and whitespace-only ones, with a random chunk size and overlap."""
+    chunk_size = rng.randint(1, 40)
+    chunk_overlap = rng.randint(0, chunk_size)
+    splits = [
+        {
+            "text": rng.choice(_SPLIT_TEXTS),
+            "token_size": rng.randint(1, chunk_size),
+            "is_sentence": rng.random() < 0.4,
+        }
+        for _ in range(rng.randint(0, 80))
+    ]
+
+    return splits, chunk_size, chunk_overlap
+
+
+def document_text(rng: random.Random, size: int) -> str:
+    """Paragraphs of random sentences, about `size` characters long."""
+    paragraphs = []
+    length = 0
+
+    while length < size:
+        sentences = [
+            " ".join(rng.choices(_WORDS, k=rng.randint(5, 25))).capitalize() + "."
+            for _ in range(rng.randint(2, 8))
+        ]
+        paragraphs.append(" ".join(sentences))
+        length += len(paragraphs[-1]) + 2
+
+    return "\n\n".join(paragraphs)
+
+
+def check_regression(cases: int, seed: int, encoding_name: str) -> List[str]:
+    """Compare `merge_splits` to the reference implementation, returning the mismatching cases."""
+    rng = random.Random(seed)
+    mismatches = []
+
+    for i in range(cases):
+        splits, chunk_size, chunk_overlap = random_case(rng)
+        if merge_splits(splits, chunk_size, chunk_overlap) != reference_merge_splits(
+            splits, chunk_size, chunk_overlap
+        ):
+            mismatches.append(f"random/{seed}/{i}")
+
+    # Splits of the text chunkers, as passed to `merge_splits` by `from_text`
+    text = document_text(rng, 200_000)
+    for chunk_size, chunk_overlap in [(64, 0), (128, 32), (512, 128)]:
+        for chunker in (
+            TokenTextChunker(chunk_size, chunk_overlap, encoding_name=encoding_name),
+            SentenceChunker(chunk_size, chunk_overlap, encoding_name=encoding_name),
+        ):
+            splits = chunker._split(text)
+            if merge_splits(
+                splits, chunk_size, chunk_overlap
+            ) != reference_merge_splits(splits, chunk_size, chunk_overlap):
+                mismatches.append(
+                    f"{type(chunker).__name__}/{chunk_size}/{chunk_overlap}"
+                )
+
+    return mismatches
+
+
+def time_scaling(sizes: List[int]) -> List[dict]:
+    """Time both implementations on growing numbers of small splits."""
+    results = []
+
+    for size in sizes:
+        splits = [{"text": "ab", "token_size": 1, "is_sentence": False}] * size
+        timings = {}
+
+        for name, fn in (
+            ("reference", reference_merge_splits),
+            ("linear", merge_splits),
+        ):
+            start = time.perf_counter()
+            fn(splits, 512, 64)
+            timings[name] = time.perf_counter() - start
+
+        results.append({"splits": size, **timings})
+
+    return results
+
+
+def time_document(size_mb: float, seed: int, encoding_name: str) -> List[dict]:
+    """Time the chunkers on a single large document."""
+    text = document_text(random.Random(seed), int(size_mb * 2**20))
+    results = []
+
+    for chunker in (
+        TokenTextChunker(encoding_name=encoding_name),
+        SentenceChunker(encoding_name=encoding_name),
+    ):
+        start = time.perf_counter()
+        chunks = chunker.from_text(text)
+        results.append(
+            {
+                "chunker": type(chunker).__name__,
+                "megabytes": len(text) / 2**20,
+                "chunks": len(chunks),
+                "seconds": time.perf_counter() - start,
+            },
+        )
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--cases", type=int, default=5000, help="Number of randomized cases."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random cases.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 20_000, 40_000, 80_000],
+        help="Numbers of splits timed with both implementations.",
+    )
+    parser.add_argument(
+        "--document-mb", type=float, default=10, help="Size of the large document."
+    )
+    parser.add_argument("--encoding", default=DEFAULT_ENCODING)
+    args = parser.parse_args()
+
+    mismatches = check_regression(args.cases, args.seed, args.encoding)
+    for key in mismatches:
+        print(f"Chunk output changed for {key}")
+    print(
+        f"Checked {args.cases} random cases and 6 chunker cases against the reference"
+    )
+
+    print(f"\n{'splits':>8} {'reference s':>12} {'linear s':>10} {'speedup':>8}")
+    for r in time_scaling(args.sizes):
+        print(
+            f"{r['splits']:>8} {r['reference']:>12.3f} {r['linear']:>10.3f} "
+            f"{r['reference'] / r['linear']:>8.1f}"
+        )
+
+    print(f"\n{'chunker':<18} {'MB':>6} {'chunks':>7} {'seconds':>8} {'MB/s':>6}")
+    for r in time_document(args.document_mb, args.seed, args.encoding):
+        print(
+            f"{r['chunker']:<18} {r['megabytes']:>6.1f} {r['chunks']:>7} "
+            f"{r['seconds']:>8.2f} {r['megabytes'] / r['seconds']:>6.2f}"
+        )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from hashlib import sha256
@@ -55,6 +56,10 @@ class TransformerComponent:
     def __call__(self, documents: List[BaseDocument]) -> List[BaseDocument]:
         """Transform documents."""
 
+    async def acall(self, documents: List[BaseDocument]) -> List[BaseDocument]:
+        """Asynchronously transform documents, `__call__` runs in a thread executor unless overridden."""
+        return await asyncio.to_thread(self, documents)
+
 
 class Document(BaseDocument):
     """Generic interface for data document."""
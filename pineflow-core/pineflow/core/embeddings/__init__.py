@@ -1,7 +1,9 @@
 from pineflow.core.embeddings.base import BaseEmbedding, Embedding, SimilarityMode
+from pineflow.core.embeddings.cache import EmbeddingCache
 
 __all__ = [
     "BaseEmbedding",
     "Embedding",
+    "EmbeddingCache",
     "SimilarityMode",
 ]
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List
@@ -52,6 +53,28 @@ class BaseEmbedding(TransformerComponent, ABC):
     def get_documents_embedding(self, documents: List[Document]) -> List[Document]:
         """Get documents embeddings."""
 
+    async def aget_text_embedding(self, query: str) -> Embedding:
+        """Asynchronously get query embedding."""
+        return (await self.aget_texts_embedding([query]))[0]
+
+    async def aget_texts_embedding(self, texts: List[str]) -> List[Embedding]:
+        """Asynchronously get text embeddings, `get_texts_embedding` runs in a thread executor unless overridden."""
+        return await asyncio.to_thread(self.get_texts_embedding, texts)
+
+    async def aget_documents_embedding(
+        self,
+        documents: List[Document],
+    ) -> List[Document]:
+        """Asynchronously get documents embeddings."""
+        embeddings = await self.aget_texts_embedding(
+            [document.get_content() for document in documents],
+        )
+
+        for document, embedding in zip(documents, embeddings):
+            document.embedding = embedding
+
+        return documents
+
     @staticmethod
     def similarity(
         embedding1: Embedding,
@@ -62,4 +85,26 @@ class BaseEmbedding(TransformerComponent, ABC):
         return similarity(embedding1, embedding2, mode)
 
     def __call__(self, documents: List[Document]) -> List[Document]:
-        return self.get_documents_embedding(documents)
+        # Parent chunks (see `HierarchicalChunker`) are only stored for context, and not embedded
+        embedded = iter(
+            self.get_documents_embedding(
+                [doc for doc in documents if not doc.metadata.get("is_parent_chunk")],
+            ),
+        )
+
+        return [
+            doc if doc.metadata.get("is_parent_chunk") else next(embedded)
+            for doc in documents
+        ]
+
+    async def acall(self, documents: List[Document]) -> List[Document]:
+        embedded = iter(
+            await self.aget_documents_embedding(
+                [doc for doc in documents if not doc.metadata.get("is_parent_chunk")],
+            ),
+        )
+
+        return [
+            doc if doc.metadata.get("is_parent_chunk") else next(embedded)
+            for doc in documents
+        ]
@@ -0,0 +1,124 @@
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Content-addressed cache of text embeddings, so unchanged texts are not embedded again on re-ingestion.
+
+    Embeddings are keyed by the hash of the embedding model name and the text. Recently used embeddings
+    are kept in an in-memory LRU tier, and all of them in an optional on-disk (SQLite) tier shared across runs.
+
+    Args:
+        path (str, optional): Path of the SQLite database file of the on-disk tier. Defaults to `None`,
+            for an in-memory cache only.
+        max_size (int, optional): Maximum number of embeddings kept in memory. Defaults to `10000`.
+
+    Example:
+        .. code-block:: python
+
+            from pineflow.core.embeddings import EmbeddingCache
+            from pineflow.core.text_chunkers import SemanticChunker
+
+            text_chunker = SemanticChunker(
+                embed_model=embedding,
+                embed_cache=EmbeddingCache("embeddings.db"),
+            )
+    """
+
+    def __init__(self, path: Optional[str] = None, max_size: int = 10000) -> None:
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._conn = None
+
+        if path is not None:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, "
+                "embedding BLOB NOT NULL)",
+            )
+            self._conn.commit()
+
+    def __getstate__(self) -> dict:
+        # Connections and locks can't be pickled, workers reopen the on-disk tier with an empty memory tier
+        return {"path": self.path, "max_size": self.max_size}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    @staticmethod
+    def _key(model_name: str, text: str) -> str:
+        return hashlib.sha256(f"{model_name}\0{text}".encode()).hexdigest()
+
+    def _remember(self, key: str, embedding: np.ndarray) -> None:
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def get_many(
+        self, model_name: str, texts: Sequence[str]
+    ) -> List[Optional[np.ndarray]]:
+        """Get the cached embeddings of many texts, `None` for the texts not cached."""
+        keys = [self._key(model_name, text) for text in texts]
+        embeddings: List[Optional[np.ndarray]] = [None] * len(keys)
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                embedding = self._memory.get(key)
+
+                if embedding is not None:
+                    self._memory.move_to_end(key)
+                    embeddings[i] = embedding
+                elif self._conn is not None:
+                    row = self._conn.execute(
+                        "SELECT embedding FROM embeddings WHERE key = ?",
+                        (key,),
+                    ).fetchone()
+
+                    if row is not None:
+                        embedding = np.frombuffer(row[0], dtype=np.float32)
+                        self._remember(key, embedding)
+                        embeddings[i] = embedding
+
+        return embeddings
+
+    def put_many(
+        self,
+        model_name: str,
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+    ) -> None:
+        """Cache the embeddings of many texts, written to disk in a single transaction."""
+        entries = {}
+
+        for text, embedding in zip(texts, embeddings):
+            entries[self._key(model_name, text)] = np.array(embedding, dtype=np.float32)
+
+        with self._lock:
+            for key, embedding in entries.items():
+                self._remember(key, embedding)
+
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings VALUES (?, ?)",
+                        [
+                            (key, embedding.tobytes())
+                            for key, embedding in entries.items()
+                        ],
+                    )
+
+    def close(self) -> None:
+        """Close the underlying database connection, if any."""
+        if self._conn is not None:
+            self._conn.close()
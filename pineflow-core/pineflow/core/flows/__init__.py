@@ -1,3 +1,14 @@
+from pineflow.core.flows.checkpoint import IngestionCheckpoint
 from pineflow.core.flows.ingestion_flow import IngestionFlow
+from pineflow.core.flows.manifest import IngestionManifest
+from pineflow.core.flows.pipeline import TransformerStage
+from pineflow.core.flows.report import IngestionReport, StageReport
 
-__all__ = ["IngestionFlow"]
+__all__ = [
+    "IngestionCheckpoint",
+    "IngestionFlow",
+    "IngestionManifest",
+    "IngestionReport",
+    "StageReport",
+    "TransformerStage",
+]
@@ -0,0 +1,60 @@
+import json
+import os
+from typing import Dict
+
+
+class IngestionCheckpoint:
+    """
+    Progress cursor of a streamed ingestion run, persisted to a JSON file so that a failed run can be resumed.
+
+    The cursor records, per input (`documents` and each reader), how many documents have been committed
+    to the vector store. Re-running the flow with the same checkpoint skips those documents instead of
+    transforming and embedding them again. The checkpoint is cleared once a run completes.
+
+    Note:
+        Resuming requires the inputs to yield documents in the same order as the failed run.
+
+    Args:
+        path (str): Path of the checkpoint JSON file.
+
+    Example:
+        .. code-block:: python
+
+            from pineflow.core.flows import IngestionCheckpoint
+
+            checkpoint = IngestionCheckpoint("ingestion_checkpoint.json")
+            ingestion_flow.run(checkpoint=checkpoint)
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._cursors = self._load()
+
+    def _load(self) -> Dict[str, int]:
+        if not os.path.isfile(self.path):
+            return {}
+
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def get(self, cursor: str) -> int:
+        """Get the number of committed documents of an input."""
+        return self._cursors.get(cursor, 0)
+
+    def advance(self, cursors: Dict[str, int]) -> None:
+        """Record committed documents and persist the checkpoint."""
+        for cursor, position in cursors.items():
+            self._cursors[cursor] = max(self.get(cursor), position)
+
+        # Write then rename, so a crash never leaves a partially written checkpoint
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._cursors, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """Reset the checkpoint and delete its file."""
+        self._cursors = {}
+
+        if os.path.isfile(self.path):
+            os.remove(self.path)
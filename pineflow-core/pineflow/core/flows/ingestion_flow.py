@@ -1,8 +1,16 @@
+import asyncio
+import time
+from collections import deque
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from pineflow.core.document.schema import Document, TransformerComponent
+from pineflow.core.flows.checkpoint import IngestionCheckpoint
+from pineflow.core.flows.manifest import IngestionManifest, ManifestKey, ManifestRecord
+from pineflow.core.flows.pipeline import TransformerStage, document_bytes, run_pipeline
+from pineflow.core.flows.report import IngestionProfiler, IngestionReport, StageReport
 from pineflow.core.readers.base import BaseReader
+from pineflow.core.utils.parallel import call_worker, process_pool_executor
 from pineflow.core.vector_stores.base import BaseVectorStore
 
 
@@ -17,18 +25,52 @@ class DocStrategy(Enum):
     DEDUPLICATE_OFF = "deduplicate_off"
 
 
+class _TransformerChain(TransformerComponent):
+    """Applies transformers in sequence, so a worker process runs the whole chain on a batch."""
+
+    def __init__(self, transformers: List[TransformerComponent]) -> None:
+        self.transformers = transformers
+
+    def __call__(self, documents: List[Document]) -> List[Document]:
+        for transformer in self.transformers:
+            documents = transformer(documents)
+
+        return documents
+
+
+def _load_reader(reader: BaseReader) -> Tuple[List[Document], float, float]:
+    # Timed in the worker, so each reader reports its own load time rather than the time spent in the pool
+    start_time = time.perf_counter()
+    start_cpu = time.process_time()
+
+    documents = reader.load_data()
+
+    return documents, time.perf_counter() - start_time, time.process_time() - start_cpu
+
+
 class IngestionFlow:
     """
     An ingestion flow for processing and storing data.
 
     Args:
         transformers (List[TransformerComponent]): A list of transformer components applied to the input documents.
+            Wrap a component in `TransformerStage` to configure its workers when streaming with `pipelined=True`.
         doc_strategy (DocStrategy): The strategy used for handling document duplicates.
             Defaults to `DocStrategy.DUPLICATE_ONLY`.
         post_transformer (bool): Whether document de-duplication should be applied after transformation step.
             Defaults to `False`.
         readers (BaseReader, optional): List of readers for loading or fetching documents.
         vector_store (BaseVectorStore, optional): Vector store for saving processed documents
+        manifest (IngestionManifest, optional): On-disk manifest of ingested documents. When set, documents
+            unchanged since the last run are skipped before transformation, and the chunks of modified
+            documents are replaced in the vector store.
+        callbacks (List[Callable[[StageReport], None]], optional): Hooks called with the statistics of every
+            reader, transformer and vector store call. The aggregated statistics of the last run are available
+            in `report`.
+        count_tokens (bool, optional): Whether to count the tokens of each stage output documents.
+            Defaults to `False`.
+        delete_batch_size (int, optional): Number of document IDs per bulk deletion request when removing
+            stale or replaced documents from the vector store. Defaults to the vector store bulk size.
 
     Example:
         .. code-block:: python
@@ -52,12 +94,79 @@ class IngestionFlow:
         post_transformer: bool = False,
         readers: Optional[List[BaseReader]] = None,
         vector_store: Optional[BaseVectorStore] = None,
+        manifest: Optional[IngestionManifest] = None,
+        callbacks: Optional[List[Callable[[StageReport], None]]] = None,
+        count_tokens: bool = False,
+        delete_batch_size: Optional[int] = None,
     ) -> None:
         self.doc_strategy = doc_strategy
         self.post_transformer = post_transformer
         self.transformers = transformers
         self.readers = readers
         self.vector_store = vector_store
+        self.manifest = manifest
+        self.callbacks = callbacks
+        self.count_tokens = count_tokens
+        self.delete_batch_size = delete_batch_size
+        self.report: Optional[IngestionReport] = None
+        self._profiler = IngestionProfiler(callbacks, count_tokens)
+
+    def _start_profiler(self) -> None:
+        self._profiler = IngestionProfiler(self.callbacks, self.count_tokens)
+        self.report = self._profiler.report
+
+    @staticmethod
+    def _component_name(component: Any) -> str:
+        if isinstance(component, TransformerStage):
+            component = component.transformer
+
+        return type(component).__name__
+
+    def _store_call(self, method: str, *args: Any, input_count: int = 0) -> Any:
+        return self._profiler.call(
+            "vector_store",
+            0,
+            method,
+            getattr(self.vector_store, method),
+            *args,
+            input_count=input_count,
+        )
+
+    def _profile_iter(
+        self,
+        kind: str,
+        index: int,
+        name: str,
+        iterator: Iterator,
+    ) -> Iterator:
+        # Time spent pulling from the iterator is recorded as a single call once it is exhausted
+        iterator = iter(iterator)
+        wall_time = cpu_time = 0.0
+        count = 0
+
+        while True:
+            start_time = time.perf_counter()
+            start_cpu = time.process_time()
+
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                wall_time += time.perf_counter() - start_time
+                cpu_time += time.process_time() - start_cpu
+
+            count += 1
+            yield item
+
+        self._profiler.add(
+            kind,
+            index,
+            name,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            output_count=count,
+        )
 
     def _read_documents(self, documents: Optional[List[Document]]):
         input_documents = []
@@ -66,14 +175,98 @@ class IngestionFlow:
             input_documents.extend(documents)
 
         if self.readers is not None:
-            for reader in self.readers:
-                input_documents.extend(reader.load_data())
+            for i, reader in enumerate(self.readers):
+                input_documents.extend(
+                    self._profiler.call(
+                        "reader",
+                        i,
+                        self._component_name(reader),
+                        reader.load_data,
+                    ),
+                )
 
         return input_documents
 
-    def _handle_duplicates(self, documents) -> List[Document]:
-        ids, existing_hashes, existing_ref_hashes = (
-            self.vector_store.get_all_document_hashes()
+    def _iter_documents(
+        self,
+        documents: Optional[List[Document]],
+        num_workers: int = 1,
+    ) -> Iterator[Tuple[str, int, Document]]:
+        """Iterate documents along with their input cursor and position in that input."""
+        if documents is not None:
+            for position, doc in enumerate(documents):
+                yield "documents", position, doc
+
+        if self.readers and num_workers > 1:
+            # Readers are loaded concurrently in worker processes, and read back in order
+            with process_pool_executor(
+                _load_reader,
+                min(num_workers, len(self.readers)),
+            ) as executor:
+                futures = [
+                    executor.submit(call_worker, reader) for reader in self.readers
+                ]
+
+                for i, (reader, future) in enumerate(zip(self.readers, futures)):
+                    reader_documents, wall_time, cpu_time = future.result()
+                    self._profiler.add(
+                        "reader",
+                        i,
+                        self._component_name(reader),
+                        wall_time=wall_time,
+                        cpu_time=cpu_time,
+                        output=reader_documents,
+                    )
+
+                    for position, doc in enumerate(reader_documents):
+                        yield f"readers.{i}", position, doc
+
+        elif self.readers is not None:
+            for i, reader in enumerate(self.readers):
+                reader_documents = self._profile_iter(
+                    "reader",
+                    i,
+                    self._component_name(reader),
+                    reader.lazy_load(),
+                )
+
+                for position, doc in enumerate(reader_documents):
+                    yield f"readers.{i}", position, doc
+
+    def _iter_batches(
+        self,
+        items: Iterator[Tuple[str, int, Document]],
+        batch_size: int,
+        max_batch_bytes: Optional[int] = None,
+    ) -> Iterator[List]:
+        batch = []
+        batch_bytes = 0
+
+        for item in items:
+            batch.append(item)
+
+            if max_batch_bytes is not None:
+                batch_bytes += document_bytes(item[2])
+
+            if len(batch) >= batch_size or (
+                max_batch_bytes is not None and batch_bytes >= max_batch_bytes
+            ):
+                yield batch
+                batch = []
+                batch_bytes = 0
+
+        if batch:
+            yield batch
+
+    def _dedup_enabled(self) -> bool:
+        return (
+            self.vector_store is not None
+            and self.doc_strategy != DocStrategy.DEDUPLICATE_OFF
+        )
+
+    def _get_existing_hashes(self) -> Tuple[List[str], List[str], List[str]]:
+        ids, existing_hashes, existing_ref_hashes = self._store_call(
+            "get_all_document_hashes"
         )
 
         if self.post_transformer:
@@ -83,67 +276,395 @@ class IngestionFlow:
             # Use parent document hash `ref_doc_hash`
             # Fallback to document own hash if `ref_doc_hash` (parent level) is missing for de-duplication
             hashes_fallback = [
-                existing_ref_hashes[i]
-                if existing_ref_hashes[i] is not None
-                else existing_hashes[i]
-                for i in range(len(existing_ref_hashes))
+                ref_hash if ref_hash is not None else _hash
+                for _hash, ref_hash in zip(existing_hashes, existing_ref_hashes)
             ]
 
-        current_hashes = []
-        current_unique_hashes = []
+        return ids, hashes_fallback, existing_ref_hashes
+
+    def _lookup_existing_hashes(self, documents: List[Document]) -> Set[str]:
+        # Only the hashes of the given documents are looked up in the vector store.
+        return self._store_call(
+            "exists_hashes",
+            [doc.hash for doc in documents],
+            not self.post_transformer,
+            input_count=len(documents),
+        )
+
+    def _filter_duplicates(
+        self,
+        documents: List[Document],
+        existing_hashes: Set[str],
+        current_hashes: Set[str],
+        current_unique_hashes: Set[str],
+    ) -> List[Document]:
+        # Hash indexes are sets, so each membership test is O(1) and de-dup is linear.
         dedup_documents_to_run = []
 
         for doc in documents:
-            current_hashes.append(doc.hash)
+            doc_hash = doc.hash
+            current_hashes.add(doc_hash)
 
             if (
-                doc.hash not in hashes_fallback
-                and doc.hash not in current_unique_hashes
+                doc_hash not in existing_hashes
+                and doc_hash not in current_unique_hashes
                 and doc.get_content() != ""
             ):
                 dedup_documents_to_run.append(doc)
-                current_unique_hashes.append(
-                    doc.hash,
+                current_unique_hashes.add(
+                    doc_hash,
                 )  # Prevent duplicating same document hash in same batch flow execution.
 
+        return dedup_documents_to_run
+
+    def _delete_stale_documents(
+        self,
+        ids: List[str],
+        hashes_fallback: List[str],
+        current_hashes: Set[str],
+        kept_ids: Set[str],
+    ) -> None:
+        # `kept_ids` are chunks of documents skipped by the manifest, still current even though unseen
+        ids_to_remove = [
+            _id
+            for _id, _hash in zip(ids, hashes_fallback)
+            if _hash not in current_hashes and _id not in kept_ids
+        ]
+
+        if self.vector_store is not None:
+            self._store_call(
+                "bulk_delete_documents",
+                ids_to_remove,
+                self.delete_batch_size,
+                input_count=len(ids_to_remove),
+            )
+
+    def _handle_duplicates(
+        self,
+        documents: List[Document],
+        kept_ids: Set[str],
+    ) -> List[Document]:
         if self.doc_strategy == DocStrategy.DUPLICATE_AND_DELETE:
-            ids_to_remove = [
-                ids[i]
-                for i in range(len(hashes_fallback))
-                if hashes_fallback[i] not in current_hashes
-            ]
+            # Stale documents detection needs every stored hash
+            ids, hashes_fallback, _ = self._get_existing_hashes()
+            existing_hashes = set(hashes_fallback)
+        else:
+            existing_hashes = self._lookup_existing_hashes(documents)
+
+        current_hashes = set()
 
-            if self.vector_store is not None:
-                self.vector_store.delete_documents(ids_to_remove)
+        dedup_documents_to_run = self._filter_duplicates(
+            documents,
+            existing_hashes,
+            current_hashes,
+            set(),
+        )
+
+        if self.doc_strategy == DocStrategy.DUPLICATE_AND_DELETE:
+            self._delete_stale_documents(
+                ids,
+                hashes_fallback,
+                current_hashes,
+                kept_ids,
+            )
 
         return dedup_documents_to_run
 
+    def _manifest_key(
+        self,
+        document: Document,
+        source_positions: Dict[str, int],
+    ) -> ManifestKey:
+        source = document.metadata.get("source")
+
+        if source is None:
+            return document.hash, 0
+
+        source = str(source)
+        position = source_positions.get(source, 0)
+        source_positions[source] = position + 1
+
+        return source, position
+
+    def _filter_unchanged(
+        self,
+        documents: List[Document],
+        source_positions: Dict[str, int],
+        kept_ids: Set[str],
+    ) -> Tuple[
+        List[Document],
+        Dict[str, Tuple[ManifestKey, str]],
+        Dict[ManifestKey, ManifestRecord],
+    ]:
+        keys = [self._manifest_key(doc, source_positions) for doc in documents]
+        records = self.manifest.get_many(keys)
+
+        documents_changed = []
+        changed = {}
+
+        for doc, key in zip(documents, keys):
+            record = records.get(key)
+
+            if record is not None and record.hash == doc.hash:
+                kept_ids.update(record.chunk_ids)
+            else:
+                documents_changed.append(doc)
+                changed[doc.id_] = (key, doc.hash)
+
+        return documents_changed, changed, records
+
+    def _resolve_skipped_ids(
+        self,
+        changed: Dict[str, Tuple[ManifestKey, str]],
+        chunks: Dict[str, List[Document]],
+        chunk_ids: Dict[str, List[str]],
+        documents_written: List[Document],
+    ) -> None:
+        written_ids = {doc.id_ for doc in documents_written}
+
+        if self.post_transformer:
+            # Chunks not written are matched by their own hash
+            hashes = [
+                chunk.hash
+                for doc_chunks in chunks.values()
+                for chunk in doc_chunks
+                if chunk.id_ not in written_ids
+            ]
+        else:
+            # Documents skipped before transformation have no chunks, they are matched by their hash
+            hashes = [changed[doc_id][1] for doc_id in chunks if not chunks[doc_id]]
+
+        if not hashes:
+            return
+
+        stored_ids = self._store_call(
+            "get_ids_by_hashes",
+            hashes,
+            not self.post_transformer,
+            input_count=len(hashes),
+        )
+
+        for doc_id, doc_chunks in chunks.items():
+            if self.post_transformer:
+                ids = [
+                    _id
+                    for chunk in doc_chunks
+                    for _id in (
+                        [chunk.id_]
+                        if chunk.id_ in written_ids
+                        else stored_ids.get(chunk.hash, [])
+                    )
+                ]
+            elif not doc_chunks:
+                ids = stored_ids.get(changed[doc_id][1], [])
+            else:
+                continue
+
+            chunk_ids[doc_id] = list(dict.fromkeys(ids))
+
+    def _commit_manifest(
+        self,
+        changed: Dict[str, Tuple[ManifestKey, str]],
+        records: Dict[ManifestKey, ManifestRecord],
+        documents_transformed: List[Document],
+        documents_written: List[Document],
+    ) -> None:
+        chunks = {doc_id: [] for doc_id in changed}
+
+        for chunk in documents_transformed:
+            parent_id = (
+                chunk.id_ if chunk.id_ in chunks else chunk.metadata.get("ref_doc_id")
+            )
+            if parent_id in chunks:
+                chunks[parent_id].append(chunk)
+
+        chunk_ids = {
+            doc_id: [chunk.id_ for chunk in doc_chunks]
+            for doc_id, doc_chunks in chunks.items()
+        }
+
+        if self._dedup_enabled():
+            # Documents and chunks skipped by de-dup are already stored, e.g. by a run without the manifest
+            # or as an identical document, and are recorded under the IDs of their stored copies. Without
+            # de-dup, every chunk was written under its own ID.
+            self._resolve_skipped_ids(changed, chunks, chunk_ids, documents_written)
+
+        previous_ids = list(
+            dict.fromkeys(
+                _id
+                for key, _ in changed.values()
+                if key in records
+                for _id in records[key].chunk_ids
+            ),
+        )
+
+        # `DUPLICATE_AND_DELETE` already removes the chunks of modified documents as stale
+        if (
+            self.vector_store is not None
+            and self.doc_strategy != DocStrategy.DUPLICATE_AND_DELETE
+        ):
+            kept_ids = {_id for ids in chunk_ids.values() for _id in ids}
+            replaced_ids = [_id for _id in previous_ids if _id not in kept_ids]
+
+            if replaced_ids:
+                self._store_call(
+                    "bulk_delete_documents",
+                    replaced_ids,
+                    self.delete_batch_size,
+                    input_count=len(replaced_ids),
+                )
+
+        # Identical documents without `source` share a key, their chunk IDs are merged into its record
+        entries = {}
+        for doc_id, (key, doc_hash) in changed.items():
+            _, ids = entries.setdefault(key, (doc_hash, {}))
+            ids.update(dict.fromkeys(chunk_ids[doc_id]))
+
+        self.manifest.upsert_many(
+            {key: (doc_hash, list(ids)) for key, (doc_hash, ids) in entries.items()},
+        )
+
+    def _trim_manifest(self, source_positions: Dict[str, int]) -> None:
+        # Remove trailing documents of sources that shrank since the last run (e.g. deleted pages)
+        for source, count in source_positions.items():
+            records = self.manifest.get_trailing(source, count)
+
+            if not records:
+                continue
+
+            stale_ids = [_id for record in records for _id in record.chunk_ids]
+
+            if (
+                self.vector_store is not None
+                and self.doc_strategy != DocStrategy.DUPLICATE_AND_DELETE
+                and stale_ids
+            ):
+                self._store_call(
+                    "bulk_delete_documents",
+                    stale_ids,
+                    self.delete_batch_size,
+                    input_count=len(stale_ids),
+                )
+
+            self.manifest.delete((record.source, record.position) for record in records)
+
+    async def _aread_documents(
+        self,
+        documents: Optional[List[Document]],
+    ) -> List[Document]:
+        input_documents = []
+
+        if documents is not None:
+            input_documents.extend(documents)
+
+        if self.readers is not None:
+            for reader_documents in await asyncio.gather(
+                *[
+                    self._profiler.acall(
+                        "reader",
+                        i,
+                        self._component_name(reader),
+                        reader.aload_data(),
+                    )
+                    for i, reader in enumerate(self.readers)
+                ],
+            ):
+                input_documents.extend(reader_documents)
+
+        return input_documents
+
+    async def _arun_transformers(
+        self,
+        documents: List[Document],
+        transformers: TransformerComponent,
+    ) -> List[Document]:
+        _documents = documents.copy()
+
+        for i, transformer in enumerate(transformers):
+            _documents = await self._profiler.acall(
+                "transformer",
+                i,
+                self._component_name(transformer),
+                transformer.acall(_documents),
+                input_count=len(_documents),
+            )
+
+        return _documents
+
     def _run_transformers(
         self,
         documents: List[Document],
         transformers: TransformerComponent,
+        release_documents: bool = False,
     ) -> List[Document]:
         _documents = documents.copy()
 
-        for transformer in transformers:
-            _documents = transformer(_documents)
+        for i, transformer in enumerate(transformers):
+            _documents = self._profiler.call(
+                "transformer",
+                i,
+                self._component_name(transformer),
+                transformer,
+                _documents,
+                input_count=len(_documents),
+            )
+
+            if release_documents and i == 0:
+                # Drop the input documents (e.g. parent documents once chunked) while later transformers run
+                documents.clear()
 
         return _documents
 
-    def run(self, documents: List[Document] = None) -> List[Document]:
+    def run(
+        self,
+        documents: List[Document] = None,
+        checkpoint: Optional[IngestionCheckpoint] = None,
+        batch_size: int = 100,
+        num_workers: int = 1,
+    ) -> List[Document]:
         """
         Run an ingestion flow.
 
         Args:
             documents: Set of documents to be transformed.
+            checkpoint (IngestionCheckpoint, optional): When set, documents are committed to the vector store
+                in batches of `batch_size` and progress is checkpointed, so a failed run resumes from the last
+                committed batch. See `stream`.
+            batch_size (int, optional): Number of input documents per committed batch when a checkpoint is set
+                or `num_workers` is greater than 1. Defaults to `100`.
+            num_workers (int, optional): Number of worker processes sharing readers and transformers.
+                See `stream`. Defaults to `1`.
 
         Example:
             .. code-block:: python
 
                 ingestion_flow.run(documents: List[Document])
         """
+        if checkpoint is not None or num_workers > 1:
+            return [
+                doc
+                for batch in self.stream(
+                    documents,
+                    batch_size,
+                    checkpoint=checkpoint,
+                    num_workers=num_workers,
+                )
+                for doc in batch
+            ]
+
+        self._start_profiler()
         documents_processed = []
+        documents_transformed = []
         input_documents = self._read_documents(documents)
+        kept_ids = set()
+
+        if self.manifest is not None:
+            source_positions = {}
+            input_documents, changed, records = self._filter_unchanged(
+                input_documents,
+                source_positions,
+                kept_ids,
+            )
 
         if (
             self.vector_store is not None
@@ -152,7 +673,7 @@ class IngestionFlow:
         ):
             # Apply transformers before de-dup (parent level)
 
-            documents_to_run = self._handle_duplicates(input_documents)
+            documents_to_run = self._handle_duplicates(input_documents, kept_ids)
         else:
             # Apply transformers after de-dup (chunk level)
             documents_to_run = input_documents
@@ -162,6 +683,94 @@ class IngestionFlow:
                 documents_to_run,
                 self.transformers,
             )
+            # The manifest records every chunk, including the unchanged ones skipped by chunk level de-dup
+            documents_transformed = documents_processed
+
+            # Apply transformers after de-dup (chunk level)
+            if (
+                self.vector_store is not None
+                and self.doc_strategy != DocStrategy.DEDUPLICATE_OFF
+                and self.post_transformer
+            ):
+                documents_processed = self._handle_duplicates(
+                    documents_processed,
+                    kept_ids,
+                )
+
+            if self.vector_store is not None and documents_processed:
+                self._store_call(
+                    "add_documents",
+                    documents_processed,
+                    input_count=len(documents_processed),
+                )
+
+        if self.manifest is not None:
+            self._commit_manifest(
+                changed,
+                records,
+                documents_transformed,
+                documents_processed,
+            )
+            self._trim_manifest(source_positions)
+
+        self._profiler.finish()
+
+        return documents_processed
+
+    async def arun(self, documents: List[Document] = None) -> List[Document]:
+        """
+        Asynchronously run an ingestion flow.
+
+        Readers are loaded concurrently with `aload_data`, transformers are applied with `acall` and
+        documents are written with `aadd_documents`. Components without native async support run in
+        a thread executor, so many flows can share a single event loop.
+
+        Args:
+            documents: Set of documents to be transformed.
+
+        Example:
+            .. code-block:: python
+
+                await ingestion_flow.arun(documents: List[Document])
+        """
+        self._start_profiler()
+        documents_processed = []
+        documents_transformed = []
+        input_documents = await self._aread_documents(documents)
+        kept_ids = set()
+
+        if self.manifest is not None:
+            source_positions = {}
+            input_documents, changed, records = await asyncio.to_thread(
+                self._filter_unchanged,
+                input_documents,
+                source_positions,
+                kept_ids,
+            )
+
+        if (
+            self.vector_store is not None
+            and self.doc_strategy != DocStrategy.DEDUPLICATE_OFF
+            and not self.post_transformer
+        ):
+            # Apply transformers before de-dup (parent level)
+
+            documents_to_run = await asyncio.to_thread(
+                self._handle_duplicates,
+                input_documents,
+                kept_ids,
+            )
+        else:
+            # Apply transformers after de-dup (chunk level)
+            documents_to_run = input_documents
+
+        if documents_to_run:
+            documents_processed = await self._arun_transformers(
+                documents_to_run,
+                self.transformers,
+            )
+            # The manifest records every chunk, including the unchanged ones skipped by chunk level de-dup
+            documents_transformed = documents_processed
 
             # Apply transformers after de-dup (chunk level)
             if (
@@ -169,9 +778,313 @@ class IngestionFlow:
                 and self.doc_strategy != DocStrategy.DEDUPLICATE_OFF
                 and self.post_transformer
             ):
-                documents_processed = self._handle_duplicates(documents_processed)
+                documents_processed = await asyncio.to_thread(
+                    self._handle_duplicates,
+                    documents_processed,
+                    kept_ids,
+                )
 
             if self.vector_store is not None and documents_processed:
-                self.vector_store.add_documents(documents_processed)
+                await self._profiler.acall(
+                    "vector_store",
+                    0,
+                    "add_documents",
+                    self.vector_store.aadd_documents(documents_processed),
+                    input_count=len(documents_processed),
+                )
+
+        if self.manifest is not None:
+            await asyncio.to_thread(
+                self._commit_manifest,
+                changed,
+                records,
+                documents_transformed,
+                documents_processed,
+            )
+            await asyncio.to_thread(self._trim_manifest, source_positions)
+
+        self._profiler.finish()
 
         return documents_processed
+
+    def stream(
+        self,
+        documents: List[Document] = None,
+        batch_size: int = 100,
+        pipelined: bool = False,
+        queue_size: int = 2,
+        checkpoint: Optional[IngestionCheckpoint] = None,
+        max_batch_bytes: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+        num_workers: int = 1,
+    ) -> Iterator[List[Document]]:
+        """
+        Run an ingestion flow in streaming mode.
+
+        Documents are pulled lazily from `documents` and from `readers` with `lazy_load`, grouped into
+        micro-batches of `batch_size`, transformed and written to the vector store one batch at a time.
+        Memory stays bounded regardless of the corpus size with readers reading their input incrementally
+        (e.g. `IBMCOSReader` object by object, `WatsonDiscoveryReader` page by page), while other readers
+        load all their documents before the first batch.
+
+        With `pipelined=True`, reading and each transformer run concurrently as stages connected by
+        bounded queues, while the vector store writes the previous batch. Worker count and worker type
+        (thread or process) are configured per transformer with `TransformerStage`.
+
+        With `num_workers` greater than 1, the flow is sharded across worker processes for CPU-bound
+        components (PDF parsing, text chunkers, local embedding models): readers are loaded concurrently
+        with `load_data`, each reader's documents being held in full, and each batch goes through the whole
+        transformer chain in a single worker. The main process remains the single writer to the vector store
+        and keeps the input order, so chunk IDs and results are identical to a serial run. Readers and
+        transformers must be picklable.
+
+        To bound memory with large documents (e.g. PDF or Docling readers), `max_batch_bytes` closes a batch
+        once the approximate size of its text reaches the limit, and `memory_budget` pauses reading while
+        the text of the batches in flight exceeds the budget. Input documents are released as soon as
+        the first transformer (typically a chunker) has processed them. Both only bound memory when
+        documents are read incrementally: documents passed as `documents` stay referenced by the caller's
+        list, and readers without an incremental `lazy_load` have read everything before the first batch.
+
+        With a `checkpoint`, the progress cursor is saved after each batch is written. If the run fails,
+        running it again with the same checkpoint skips the already committed documents.
+
+        Note:
+            With `DocStrategy.DUPLICATE_AND_DELETE`, stale documents are only deleted from the vector store
+            once the stream has been fully consumed.
+
+        Args:
+            documents: Set of documents to be transformed.
+            batch_size (int, optional): Number of input documents processed per batch. Defaults to `100`.
+            pipelined (bool, optional): Whether to run transformers as concurrent stages. Defaults to `False`.
+            queue_size (int, optional): Maximum number of batches buffered between two pipelined stages.
+                Defaults to `2`.
+            checkpoint (IngestionCheckpoint, optional): Checkpoint used to record and resume progress.
+            max_batch_bytes (int, optional): Maximum approximate size, in bytes, of the text of a batch.
+                Batches are only bounded by `batch_size` by default.
+            memory_budget (int, optional): Maximum approximate size, in bytes, of the text of the batches
+                in flight when pipelined. A batch larger than the budget is processed alone.
+                Unbounded by default.
+            num_workers (int, optional): Number of worker processes. Takes precedence over `pipelined` stages.
+                Defaults to `1`.
+
+        Yields:
+            List[Document]: The processed documents of each batch.
+
+        Example:
+            .. code-block:: python
+
+                for batch in ingestion_flow.stream(batch_size=50):
+                    print(f"Ingested {len(batch)} documents")
+        """
+        if batch_size < 1:
+            raise ValueError(f"`batch_size` must be at least 1, got {batch_size}.")
+
+        if max_batch_bytes is not None and max_batch_bytes < 1:
+            raise ValueError(
+                f"`max_batch_bytes` must be at least 1, got {max_batch_bytes}.",
+            )
+
+        if memory_budget is not None and memory_budget < 1:
+            raise ValueError(
+                f"`memory_budget` must be at least 1, got {memory_budget}."
+            )
+
+        if num_workers < 1:
+            raise ValueError(f"`num_workers` must be at least 1, got {num_workers}.")
+
+        self._start_profiler()
+
+        dedup_enabled = self._dedup_enabled()
+        delete_stale = (
+            dedup_enabled and self.doc_strategy == DocStrategy.DUPLICATE_AND_DELETE
+        )
+
+        if delete_stale:
+            # Stale documents detection needs every stored hash
+            ids, hashes_fallback, ref_hashes = self._get_existing_hashes()
+            existing_hashes = set(hashes_fallback)
+
+        # De-duplication state is shared across batches, so duplicates are detected flow-wide.
+        current_hashes = set()
+        current_unique_hashes = set()
+        source_positions = {}
+        kept_ids = set()
+        # IDs written by this run, current even when they overwrote the ID of a stale stored document
+        written_ids = set()
+        # Hashes of documents committed by a previous (resumed) run
+        resumed_hashes = set()
+        # `(has_documents, (manifest changes, manifest records, cursors))` of each batch, in input order
+        batch_states = deque()
+
+        def filter_duplicates(batch: List[Document]) -> List[Document]:
+            return self._filter_duplicates(
+                batch,
+                existing_hashes
+                if delete_stale
+                else self._lookup_existing_hashes(batch),
+                current_hashes,
+                current_unique_hashes,
+            )
+
+        def commit_batch(
+            state: tuple,
+            documents_transformed: List[Document],
+            documents_processed: List[Document],
+        ) -> None:
+            changed, records, cursors = state
+
+            if self.manifest is not None:
+                self._commit_manifest(
+                    changed,
+                    records,
+                    documents_transformed,
+                    documents_processed,
+                )
+
+            if checkpoint is not None:
+                checkpoint.advance(cursors)
+
+        def commit_empty_batches() -> None:
+            # Batches emptied by de-dup are committed once every earlier batch is
+            while batch_states and not batch_states[0][0]:
+                commit_batch(batch_states.popleft()[1], [], [])
+
+        def dedup_batches() -> Iterator[List[Document]]:
+            for items in self._iter_batches(
+                self._iter_documents(documents, num_workers),
+                batch_size,
+                max_batch_bytes,
+            ):
+                cursors = {}
+                batch = []
+                resumed = []
+
+                for cursor, position, doc in items:
+                    cursors[cursor] = position + 1
+
+                    if checkpoint is not None and position < checkpoint.get(cursor):
+                        resumed.append(doc)
+                    else:
+                        batch.append(doc)
+
+                # `items` is shared with `_iter_batches`, empty it so documents are not held while suspended
+                items.clear()
+
+                if resumed:
+                    # Account for committed documents as if they had been processed again
+                    resumed_hashes.update(doc.hash for doc in resumed)
+
+                    if self.manifest is not None:
+                        self._filter_unchanged(resumed, source_positions, kept_ids)
+
+                changed, records = {}, {}
+                if self.manifest is not None:
+                    batch, changed, records = self._filter_unchanged(
+                        batch,
+                        source_positions,
+                        kept_ids,
+                    )
+
+                if dedup_enabled and not self.post_transformer:
+                    batch = filter_duplicates(batch)
+
+                batch_states.append((bool(batch), (changed, records, cursors)))
+
+                # Already committed documents are not processed, release them before suspending like `items`
+                resumed = None
+
+                if batch:
+                    yield batch
+
+        if num_workers > 1:
+            stages = [
+                TransformerStage(
+                    _TransformerChain(self.transformers),
+                    num_workers=num_workers,
+                    executor="process",
+                ),
+            ]
+        elif pipelined:
+            stages = [
+                transformer
+                if isinstance(transformer, TransformerStage)
+                else TransformerStage(transformer)
+                for transformer in self.transformers
+            ]
+
+        if num_workers > 1 or pipelined:
+            processed_batches = run_pipeline(
+                dedup_batches(),
+                stages,
+                queue_size,
+                memory_budget=memory_budget,
+                on_batch=lambda index, stage, wall_time, input_count, output: (
+                    self._profiler.add(
+                        "transformer",
+                        index,
+                        self._component_name(stage),
+                        wall_time=wall_time,
+                        input_count=input_count,
+                        output=output,
+                    )
+                ),
+            )
+        else:
+            processed_batches = (
+                self._run_transformers(batch, self.transformers, release_documents=True)
+                for batch in dedup_batches()
+            )
+
+        for documents_processed in processed_batches:
+            # The manifest records every chunk, including the unchanged ones skipped by chunk level de-dup
+            documents_transformed = documents_processed
+
+            if dedup_enabled and self.post_transformer:
+                documents_processed = filter_duplicates(documents_processed)
+
+            if self.vector_store is not None and documents_processed:
+                self._store_call(
+                    "add_documents",
+                    documents_processed,
+                    input_count=len(documents_processed),
+                )
+
+                if delete_stale:
+                    written_ids.update(doc.id_ for doc in documents_processed)
+
+            commit_empty_batches()
+            commit_batch(
+                batch_states.popleft()[1],
+                documents_transformed,
+                documents_processed,
+            )
+            commit_empty_batches()
+
+            yield documents_processed
+
+        commit_empty_batches()
+
+        if self.manifest is not None:
+            self._trim_manifest(source_positions)
+
+        if delete_stale:
+            # Documents committed by a resumed run are current, along with their chunks
+            current_hashes.update(resumed_hashes)
+            kept_ids.update(
+                _id
+                for _id, ref_hash in zip(ids, ref_hashes)
+                if ref_hash in resumed_hashes
+            )
+            kept_ids.update(written_ids)
+
+            self._delete_stale_documents(
+                ids,
+                hashes_fallback,
+                current_hashes,
+                kept_ids,
+            )
+
+        if checkpoint is not None:
+            checkpoint.clear()
+
+        self._profiler.finish()
@@ -0,0 +1,132 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+ManifestKey = Tuple[str, int]
+
+
+class ManifestRecord(BaseModel):
+    """Ingestion record of a source document."""
+
+    source: str
+    position: int
+    hash: str
+    chunk_ids: List[str]
+    ingested_at: float
+
+
+class IngestionManifest:
+    """
+    Local on-disk (SQLite) manifest of ingested documents, used by `IngestionFlow` for incremental re-ingestion.
+
+    Each input document is keyed by its `source` metadata and its position among the documents of
+    that source (e.g. the page number of a PDF), and records its content hash, the IDs of the chunks
+    written to the vector store and the last ingestion time. Documents without `source` are keyed by
+    their content hash.
+
+    Args:
+        path (str, optional): Path of the SQLite database file. Defaults to `pineflow_manifest.db`.
+
+    Example:
+        .. code-block:: python
+
+            from pineflow.core.flows import IngestionFlow, IngestionManifest
+
+            ingestion_flow = IngestionFlow(
+                transformers=[...],
+                vector_store=vector_store,
+                manifest=IngestionManifest("manifest.db"),
+            )
+    """
+
+    def __init__(self, path: str = "pineflow_manifest.db") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "source TEXT NOT NULL, "
+            "position INTEGER NOT NULL, "
+            "hash TEXT NOT NULL, "
+            "chunk_ids TEXT NOT NULL, "
+            "ingested_at REAL NOT NULL, "
+            "PRIMARY KEY (source, position))",
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _to_record(row: tuple) -> ManifestRecord:
+        return ManifestRecord(
+            source=row[0],
+            position=row[1],
+            hash=row[2],
+            chunk_ids=json.loads(row[3]),
+            ingested_at=row[4],
+        )
+
+    def get(self, key: ManifestKey) -> Optional[ManifestRecord]:
+        """Get the record of a `(source, position)` key."""
+        return self.get_many([key]).get(key)
+
+    def get_many(
+        self, keys: Iterable[ManifestKey]
+    ) -> Dict[ManifestKey, ManifestRecord]:
+        """Get the records of many `(source, position)` keys, missing keys are skipped."""
+        records = {}
+
+        with self._lock:
+            for source, position in set(keys):
+                row = self._conn.execute(
+                    "SELECT source, position, hash, chunk_ids, ingested_at "
+                    "FROM documents WHERE source = ? AND position = ?",
+                    (source, position),
+                ).fetchone()
+
+                if row is not None:
+                    records[(source, position)] = self._to_record(row)
+
+        return records
+
+    def get_trailing(self, source: str, position: int) -> List[ManifestRecord]:
+        """Get the records of a source at or after `position`."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, position, hash, chunk_ids, ingested_at "
+                "FROM documents WHERE source = ? AND position >= ?",
+                (source, position),
+            ).fetchall()
+
+        return [self._to_record(row) for row in rows]
+
+    def upsert(self, key: ManifestKey, doc_hash: str, chunk_ids: List[str]) -> None:
+        """Insert or replace the record of a `(source, position)` key."""
+        self.upsert_many({key: (doc_hash, chunk_ids)})
+
+    def upsert_many(self, entries: Dict[ManifestKey, Tuple[str, List[str]]]) -> None:
+        """Insert or replace many records in a single transaction."""
+        ingested_at = time.time()
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?)",
+                [
+                    (source, position, doc_hash, json.dumps(chunk_ids), ingested_at)
+                    for (source, position), (doc_hash, chunk_ids) in entries.items()
+                ],
+            )
+
+    def delete(self, keys: Iterable[ManifestKey]) -> None:
+        """Delete the records of the given `(source, position)` keys."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM documents WHERE source = ? AND position = ?",
+                list(keys),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
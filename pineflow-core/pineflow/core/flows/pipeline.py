@@ -0,0 +1,288 @@
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Iterator, List, Literal, Optional
+
+from pineflow.core.document.schema import Document, TransformerComponent
+from pineflow.core.utils.parallel import call_worker, process_pool_executor
+
+_END = object()
+
+
+class _PipelineError:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def document_bytes(document: Document) -> int:
+    """Approximate in-memory size of the text of a document, in bytes."""
+    return sys.getsizeof(document.get_content())
+
+
+class _MemoryBudget:
+    """Bounds the approximate size of the input batches in flight in a pipeline."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self.sizes = deque()
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int, stop: threading.Event) -> bool:
+        """Block until `size` bytes fit in the budget; give up if the pipeline is stopped."""
+        with self._condition:
+            # A batch larger than the whole budget is let through alone, so the pipeline never stalls
+            while self.used and self.used + size > self.limit:
+                if stop.is_set():
+                    return False
+                self._condition.wait(timeout=0.1)
+
+            self.used += size
+            self.sizes.append(size)
+            return True
+
+    def release(self) -> None:
+        """Release the oldest batch in flight."""
+        with self._condition:
+            self.used -= self.sizes.popleft()
+            self._condition.notify_all()
+
+
+class TransformerStage(TransformerComponent):
+    """
+    A transformer component paired with the workers that run it when an ingestion flow is pipelined.
+
+    Args:
+        transformer (TransformerComponent): Transformer component executed by the stage.
+        num_workers (int, optional): Number of batches transformed concurrently. Default is `1`.
+        executor (str, optional): Kind of workers used by the stage. Use `"thread"` for I/O-bound
+            components (embedding APIs, remote models) and `"process"` for CPU-bound ones (text chunkers).
+            Process workers require a picklable transformer. Default is `"thread"`.
+
+    Example:
+        .. code-block:: python
+
+            from pineflow.core.flows import IngestionFlow, TransformerStage
+            from pineflow.core.text_chunkers import SentenceChunker
+            from pineflow.embeddings.watsonx import WatsonxEmbedding
+
+            ingestion_flow = IngestionFlow(
+                transformers=[
+                    TransformerStage(
+                        SentenceChunker(), num_workers=4, executor="process"
+                    ),
+                    TransformerStage(WatsonxEmbedding(...), num_workers=8),
+                ]
+            )
+    """
+
+    def __init__(
+        self,
+        transformer: TransformerComponent,
+        num_workers: int = 1,
+        executor: Literal["thread", "process"] = "thread",
+    ) -> None:
+        if num_workers < 1:
+            raise ValueError(f"`num_workers` must be at least 1, got {num_workers}.")
+
+        if executor not in ("thread", "process"):
+            raise ValueError(
+                f"`executor` must be 'thread' or 'process', got '{executor}'.",
+            )
+
+        self.transformer = transformer
+        self.num_workers = num_workers
+        self.executor = executor
+
+    def __call__(self, documents: List[Document]) -> List[Document]:
+        return self.transformer(documents)
+
+    def _create_executor(self) -> Executor:
+        if self.executor == "process":
+            return process_pool_executor(self.transformer, self.num_workers)
+
+        return ThreadPoolExecutor(max_workers=self.num_workers)
+
+    def _submit(self, executor: Executor, documents: List[Document]):
+        if self.executor == "process":
+            return executor.submit(call_worker, documents)
+
+        return executor.submit(self.transformer, documents)
+
+
+def _put(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """Block until `item` is queued; give up if the pipeline is stopped."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q: queue.Queue, stop: threading.Event):
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return _END
+
+
+def _feed(
+    batches: Iterator[List[Document]],
+    out_queue: queue.Queue,
+    stop: threading.Event,
+    budget: Optional[_MemoryBudget],
+) -> None:
+    try:
+        for batch in batches:
+            if budget is not None and not budget.acquire(
+                sum(document_bytes(doc) for doc in batch),
+                stop,
+            ):
+                return
+
+            if not _put(out_queue, batch, stop):
+                return
+    except BaseException as e:
+        _put(out_queue, _PipelineError(e), stop)
+        return
+
+    _put(out_queue, _END, stop)
+
+
+def _run_stage(
+    index: int,
+    stage: TransformerStage,
+    executor: Executor,
+    in_queue: queue.Queue,
+    out_queue: queue.Queue,
+    stop: threading.Event,
+    on_batch: Optional[Callable],
+) -> None:
+    # Futures are drained in submission order, so the stage preserves batch order.
+    pending = deque()
+
+    def complete() -> bool:
+        future, submitted_at, batch = pending.popleft()
+        documents = future.result()
+
+        if on_batch is not None:
+            on_batch(
+                index, stage, time.perf_counter() - submitted_at, len(batch), documents
+            )
+
+        # Release the input documents (e.g. parent documents once chunked) while later stages run
+        if documents is not batch:
+            batch.clear()
+
+        return _put(out_queue, documents, stop)
+
+    try:
+        while True:
+            item = _get(in_queue, stop)
+
+            if item is _END or isinstance(item, _PipelineError):
+                while pending:
+                    if not complete():
+                        return
+                _put(out_queue, item, stop)
+                return
+
+            pending.append((stage._submit(executor, item), time.perf_counter(), item))
+
+            if len(pending) >= stage.num_workers:
+                if not complete():
+                    return
+    except BaseException as e:
+        _put(out_queue, _PipelineError(e), stop)
+
+
+def run_pipeline(
+    batches: Iterator[List[Document]],
+    stages: List[TransformerStage],
+    queue_size: int = 2,
+    on_batch: Optional[Callable] = None,
+    memory_budget: Optional[int] = None,
+) -> Iterator[List[Document]]:
+    """
+    Run batches through transformer stages concurrently.
+
+    Reading and every stage run in their own threads, connected by bounded queues, so
+    all stages work on different batches at the same time. Output batches keep the input order.
+    Input batches are emptied once transformed, so their documents can be garbage collected.
+
+    Args:
+        batches (Iterator[List[Document]]): Input batches, consumed lazily.
+        stages (List[TransformerStage]): Stages applied to each batch, in order.
+        queue_size (int, optional): Maximum number of batches buffered between two stages. Default is `2`.
+        on_batch (Callable, optional): Called as `on_batch(index, stage, wall_time, input_count, documents)`
+            after each batch is transformed by a stage.
+        memory_budget (int, optional): Maximum approximate size, in bytes, of the text of the input batches
+            in flight. Reading is paused until enough batches have been consumed. Unbounded by default.
+
+    Yields:
+        List[Document]: The transformed batches.
+    """
+    stop = threading.Event()
+    budget = _MemoryBudget(memory_budget) if memory_budget is not None else None
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    executors = [stage._create_executor() for stage in stages]
+    threads = [
+        threading.Thread(
+            target=_feed,
+            args=(batches, queues[0], stop, budget),
+            daemon=True,
+        ),
+    ]
+
+    for i, stage in enumerate(stages):
+        threads.append(
+            threading.Thread(
+                target=_run_stage,
+                args=(
+                    i,
+                    stage,
+                    executors[i],
+                    queues[i],
+                    queues[i + 1],
+                    stop,
+                    on_batch,
+                ),
+                daemon=True,
+            ),
+        )
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = queues[-1].get()
+
+            if item is _END:
+                return
+
+            if isinstance(item, _PipelineError):
+                raise item.error
+
+            yield item
+
+            if budget is not None:
+                budget.release()
+    finally:
+        stop.set()
+
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for thread in threads:
+            thread.join()
+
+        for executor in executors:
+            executor.shutdown(wait=True)
@@ -0,0 +1,215 @@
+import sys
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from pineflow.core.text_chunkers.utils import count_tokens
+from pydantic import BaseModel
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def _peak_rss() -> int:
+    """Peak resident memory (high-water mark) of the process, in bytes."""
+    if resource is None:
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is reported in bytes on macOS and in kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageReport(BaseModel):
+    """
+    Execution statistics of an ingestion flow stage.
+
+    Args:
+        kind (str): Stage kind, one of `"reader"`, `"transformer"` or `"vector_store"`.
+        index (int): Position of the reader or transformer in the flow, `0` for the vector store.
+        name (str): Component class name, or method name for vector store calls.
+        calls (int): Number of calls.
+        wall_time (float): Wall time, in seconds.
+        cpu_time (float): Process CPU time, in seconds. Not measured for pipelined stages.
+        input_count (int): Number of input documents.
+        output_count (int): Number of output documents.
+        token_count (int): Number of tokens of the output documents, when token counting is enabled.
+        peak_rss (int): Peak resident memory of the whole process at the end of the stage, in bytes. It is a
+            high-water mark, which never decreases over a run and includes the memory of the other stages.
+        peak_rss_increase (int): Increase of the process peak resident memory during the stage calls, in
+            bytes, so only the stages that raised the process peak are non-zero. Not measured for readers,
+            pipelined stages and `arun`, whose calls overlap with other stages.
+    """
+
+    kind: str
+    index: int
+    name: str
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    input_count: int = 0
+    output_count: int = 0
+    token_count: int = 0
+    peak_rss: int = 0
+    peak_rss_increase: int = 0
+
+
+class IngestionReport(BaseModel):
+    """Execution report of an ingestion flow run, with per-stage statistics."""
+
+    stages: List[StageReport] = []
+    wall_time: float = 0.0
+
+    def bottleneck(self) -> Optional[StageReport]:
+        """Get the stage with the largest wall time."""
+        return max(self.stages, key=lambda stage: stage.wall_time, default=None)
+
+
+class IngestionProfiler:
+    """
+    Records the execution statistics of an ingestion flow run into an `IngestionReport`.
+
+    Args:
+        callbacks (List[Callable[[StageReport], None]], optional): Called with the statistics of every single stage call.
+        count_tokens (bool, optional): Whether to count the tokens of output documents. Defaults to `False`.
+    """
+
+    def __init__(
+        self,
+        callbacks: Optional[List[Callable[[StageReport], None]]] = None,
+        count_tokens: bool = False,
+    ) -> None:
+        self.callbacks = callbacks or []
+        self.count_tokens = count_tokens
+        self.report = IngestionReport()
+        self._lock = threading.Lock()
+        self._start_time = time.perf_counter()
+
+    def _count(self, output: Any, output_count: int) -> tuple:
+        if not isinstance(output, list):
+            return output_count, 0
+
+        token_count = 0
+        if self.count_tokens:
+            token_count = sum(
+                count_tokens(doc.get_content())
+                for doc in output
+                if hasattr(doc, "get_content")
+            )
+
+        return len(output), token_count
+
+    def add(
+        self,
+        kind: str,
+        index: int,
+        name: str,
+        wall_time: float,
+        cpu_time: float = 0.0,
+        input_count: int = 0,
+        output: Any = None,
+        output_count: int = 0,
+        peak_rss_increase: int = 0,
+    ) -> None:
+        """Record a stage call, `output_count` is used when `output` is not a list of documents."""
+        output_count, token_count = self._count(output, output_count)
+        call = StageReport(
+            kind=kind,
+            index=index,
+            name=name,
+            calls=1,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            input_count=input_count,
+            output_count=output_count,
+            token_count=token_count,
+            peak_rss=_peak_rss(),
+            peak_rss_increase=peak_rss_increase,
+        )
+
+        with self._lock:
+            stage = next(
+                (
+                    stage
+                    for stage in self.report.stages
+                    if (stage.kind, stage.index, stage.name) == (kind, index, name)
+                ),
+                None,
+            )
+
+            if stage is None:
+                stage = StageReport(kind=kind, index=index, name=name)
+                self.report.stages.append(stage)
+
+            stage.calls += 1
+            stage.wall_time += wall_time
+            stage.cpu_time += cpu_time
+            stage.input_count += input_count
+            stage.output_count += output_count
+            stage.token_count += token_count
+            stage.peak_rss = max(stage.peak_rss, call.peak_rss)
+            stage.peak_rss_increase += peak_rss_increase
+            self.report.wall_time = time.perf_counter() - self._start_time
+
+        for callback in self.callbacks:
+            callback(call)
+
+    def call(
+        self,
+        kind: str,
+        index: int,
+        name: str,
+        fn: Callable,
+        *args: Any,
+        input_count: int = 0,
+    ) -> Any:
+        """Call `fn` and record its statistics."""
+        start_time = time.perf_counter()
+        start_cpu = time.process_time()
+        start_rss = _peak_rss()
+
+        output = fn(*args)
+
+        self.add(
+            kind,
+            index,
+            name,
+            wall_time=time.perf_counter() - start_time,
+            cpu_time=time.process_time() - start_cpu,
+            input_count=input_count,
+            output=output,
+            peak_rss_increase=_peak_rss() - start_rss,
+        )
+
+        return output
+
+    async def acall(
+        self,
+        kind: str,
+        index: int,
+        name: str,
+        coroutine: Any,
+        input_count: int = 0,
+    ) -> Any:
+        """Await `coroutine` and record its wall time."""
+        start_time = time.perf_counter()
+
+        output = await coroutine
+
+        self.add(
+            kind,
+            index,
+            name,
+            wall_time=time.perf_counter() - start_time,
+            input_count=input_count,
+            output=output,
+        )
+
+        return output
+
+    def finish(self) -> IngestionReport:
+        """Set the total wall time and return the report."""
+        self.report.wall_time = time.perf_counter() - self._start_time
+        return self.report
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Iterator, List
 
 from pineflow.core.document import Document
 from pydantic.v1 import BaseModel
@@ -16,8 +17,19 @@ class BaseReader(ABC, BaseModel):
     def load_data(self) -> List[Document]:
         """Loads data."""
 
+    async def aload_data(self, *args: Any, **kwargs: Any) -> List[Document]:
+        """Asynchronously loads data, `load_data` runs in a thread executor unless overridden."""
+        return await asyncio.to_thread(self.load_data, *args, **kwargs)
+
     def load(self) -> List[Document]:
         return self.load_data()
 
-    def lazy_load(self) -> List[Document]:
-        return self.load_data()
+    def lazy_load(self, *args: Any, **kwargs: Any) -> Iterator[Document]:
+        """
+        Lazily loads data, one document at a time.
+
+        Readers that can read their input incrementally (e.g. file by file or page by page) override it,
+        so only the documents being processed are held in memory. Defaults to iterating `load_data`,
+        which loads all the documents at once.
+        """
+        yield from self.load_data(*args, **kwargs)
@@ -1,7 +1,7 @@
 import glob
 import os
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import Iterator, List, Optional, Type
 
 from pineflow.core.document import Document
 from pineflow.core.readers import BaseReader
@@ -57,6 +57,18 @@ class DirectoryReader(BaseReader):
         Returns:
             List[Document]: A list of documents loaded from the directory.
         """
+        return list(self.lazy_load(input_dir))
+
+    def lazy_load(self, input_dir: str) -> Iterator[Document]:
+        """
+        Lazily loads data from the specified directory, one file at a time.
+
+        Args:
+            input_dir (str): Directory path from which to load the documents.
+
+        Yields:
+            Document: The documents loaded from the directory.
+        """
         if not os.path.isdir(input_dir):
             raise ValueError(f"`{input_dir}` is not a valid directory.")
 
@@ -64,9 +76,8 @@ class DirectoryReader(BaseReader):
             self.file_loader = _loading_default_supported_readers()
 
         input_dir = Path(input_dir)
-        documents = []
 
-        pattern_prefix = "**/*" if self.recursive else ""
+        pattern_prefix = "**/*" if self.recursive else "*"
 
         for extension in self.required_exts:
             files = glob.glob(
@@ -79,12 +90,9 @@ class DirectoryReader(BaseReader):
                 if loader_cls:
                     try:
                         # TODO add `file_reader_kwargs`
-                        doc = loader_cls().load_data(file_dir)
-                        documents.extend(doc)
+                        yield from loader_cls().lazy_load(file_dir)
                     except Exception as e:
-                        raise f"Error reading {file_dir}: {e}"
+                        raise ValueError(f"Error reading {file_dir}: {e}") from e
                 else:
                     # TODO add `unstructured file` support
-                    raise f"Unsupported file type: {extension}"
-
-        return documents
+                    raise ValueError(f"Unsupported file type: {extension}")
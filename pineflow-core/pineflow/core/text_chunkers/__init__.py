@@ -1,10 +1,14 @@
 from pineflow.core.text_chunkers.base import BaseTextChunker
+from pineflow.core.text_chunkers.hierarchical import HierarchicalChunker
+from pineflow.core.text_chunkers.markdown import MarkdownChunker
 from pineflow.core.text_chunkers.semantic import SemanticChunker
 from pineflow.core.text_chunkers.sentence import SentenceChunker
 from pineflow.core.text_chunkers.token import TokenTextChunker
 
 __all__ = [
     "BaseTextChunker",
+    "HierarchicalChunker",
+    "MarkdownChunker",
     "SemanticChunker",
     "SentenceChunker",
     "TokenTextChunker",
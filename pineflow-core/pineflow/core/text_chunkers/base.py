@@ -1,7 +1,11 @@
+import math
+import os
+import uuid
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 
 from pineflow.core.document.schema import Document, TransformerComponent
+from pineflow.core.utils.parallel import call_worker, process_pool_executor
 
 
 class BaseTextChunker(TransformerComponent, ABC):
@@ -15,9 +19,122 @@ class BaseTextChunker(TransformerComponent, ABC):
     def from_text(self, text: str) -> List[str]:
         """Chunk text."""
 
+    @abstractmethod
+    def from_text_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """Chunk text into `(start, end)` character offsets."""
+
     @abstractmethod
     def from_documents(self, documents: List[Document]) -> List[Document]:
         """Chunk list of documents."""
 
     def __call__(self, documents: List[Document]) -> List[Document]:
         return self.from_documents(documents)
+
+    def batch_from_documents(
+        self,
+        documents: List[Document],
+        num_workers: Optional[int] = None,
+    ) -> List[Document]:
+        """
+        Split documents into chunks in parallel worker processes.
+
+        Documents are sharded across the workers, each worker holding its own copy of the chunker
+        (tokenizer and sentence models are loaded once per worker). Chunks keep the input order and
+        get the same IDs as with `from_documents`.
+
+        Note:
+            Worker processes are spawned, so the calling script must be guarded by `if __name__ == "__main__":`.
+
+        Args:
+            documents (List[Document]): List of `Document` objects to split.
+            num_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+        Returns:
+            List[Document]: List of chunked documents objects.
+
+        Example:
+            .. code-block:: python
+
+                chunks = text_chunker.batch_from_documents(documents, num_workers=8)
+        """
+        num_workers = num_workers or os.cpu_count() or 1
+
+        if num_workers == 1 or len(documents) <= 1:
+            return self.from_documents(documents)
+
+        # Several shards per worker keep workers busy when document sizes vary
+        shard_size = math.ceil(len(documents) / (num_workers * 4))
+        shards = [
+            documents[i : i + shard_size] for i in range(0, len(documents), shard_size)
+        ]
+
+        with process_pool_executor(self, min(num_workers, len(shards))) as executor:
+            return [
+                chunk
+                for chunks in executor.map(call_worker, shards)
+                for chunk in chunks
+            ]
+
+    def _create_chunks(
+        self,
+        document: Document,
+        texts: List[str],
+        offsets: Optional[List[Tuple[int, int]]] = None,
+        metadata: Optional[List[dict]] = None,
+    ) -> List[Document]:
+        """
+        Create the chunk documents of a document.
+
+        Chunk IDs are derived from the document ID and the chunk content, so chunking the same document
+        always yields the same IDs, whatever the process it runs in. Chunks left unchanged by an edit of
+        the document keep their IDs, while changed chunks get new ones and never overwrite stored chunks.
+        When `offsets` are given, they are stored as `start_char_idx` and `end_char_idx` metadata,
+        and `metadata` gives extra metadata of each chunk.
+        """
+        chunks = []
+        # Occurrences of each chunk text, so repeated chunks of a document get distinct IDs
+        occurrences = {}
+
+        for i, text in enumerate(texts):
+            chunk_metadata = {
+                **document.get_metadata(),
+                "ref_doc_id": document.id_,
+                "ref_doc_hash": document.hash,
+            }
+
+            if offsets is not None:
+                chunk_metadata["start_char_idx"], chunk_metadata["end_char_idx"] = (
+                    offsets[i]
+                )
+
+            if metadata is not None:
+                chunk_metadata.update(metadata[i])
+
+            chunk = Document(text=text, metadata=chunk_metadata)
+            occurrence = occurrences.get(chunk.hash, 0)
+            occurrences[chunk.hash] = occurrence + 1
+            chunk.id_ = str(
+                uuid.uuid5(
+                    uuid.NAMESPACE_OID,
+                    f"{document.id_}:{chunk.hash}:{occurrence}",
+                ),
+            )
+            chunks.append(chunk)
+
+        return chunks
+
+    def _chunk_document(
+        self, document: Document, include_offsets: bool
+    ) -> List[Document]:
+        text = document.get_content()
+
+        if not include_offsets:
+            return self._create_chunks(document, self.from_text(text))
+
+        # Chunk texts are sliced from the document text in a single copy each
+        offsets = self.from_text_offsets(text)
+        return self._create_chunks(
+            document,
+            [text[start:end] for start, end in offsets],
+            offsets,
+        )
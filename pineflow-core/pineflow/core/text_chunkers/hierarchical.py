@@ -0,0 +1,116 @@
+from typing import List, Optional, Tuple
+
+from pineflow.core.document import Document
+from pineflow.core.text_chunkers.base import BaseTextChunker
+
+
+class HierarchicalChunker(BaseTextChunker):
+    """
+    Designed to split documents into large parent chunks, stored once, and small child chunks for retrieval.
+
+    Each parent chunk is split again into child chunks that reference it by its ID in their `parent_id`
+    metadata. Parents carry the full document metadata, while children only carry `parent_id`, `ref_doc_id`,
+    `ref_doc_hash` and the `child_metadata_keys`, keeping the vector store payload small. Matched children
+    are resolved to their parents with `BaseVectorStore.get_parent_documents`.
+
+    Parents are returned along with the children so both are written by the same flow, and are marked
+    with an `is_parent_chunk` metadata so they are stored for lookup by ID but never vectorized: embedding
+    models skip them, `ElasticsearchVectorStore` indexes them without a vector and `ChromaVectorStore`
+    keeps them in a separate `<collection_name>-parents` collection, so only children are matched by
+    similarity search. Other vector stores must skip embedding `is_parent_chunk` documents likewise.
+
+    Args:
+        parent_chunker (BaseTextChunker): Chunker splitting documents into parent chunks.
+        child_chunker (BaseTextChunker): Chunker splitting parent chunks into child chunks.
+        child_metadata_keys (List[str], optional): Document metadata keys also copied into child chunks,
+            e.g. for filtering. Defaults to `None`.
+
+    Example:
+        .. code-block:: python
+
+            from pineflow.core.text_chunkers import HierarchicalChunker, SentenceChunker
+
+            text_chunker = HierarchicalChunker(
+                parent_chunker=SentenceChunker(chunk_size=2048, chunk_overlap=0),
+                child_chunker=SentenceChunker(chunk_size=256, chunk_overlap=32),
+            )
+    """
+
+    def __init__(
+        self,
+        parent_chunker: BaseTextChunker,
+        child_chunker: BaseTextChunker,
+        child_metadata_keys: Optional[List[str]] = None,
+    ) -> None:
+        self.parent_chunker = parent_chunker
+        self.child_chunker = child_chunker
+        self.child_metadata_keys = child_metadata_keys or []
+
+    def from_text(self, text: str) -> List[str]:
+        """
+        Split text into child chunks.
+
+        Args:
+            text (str): Input text to split.
+
+        Returns:
+            List[str]: List of child text chunks.
+        """
+        return [
+            child
+            for parent in self.parent_chunker.from_text(text)
+            for child in self.child_chunker.from_text(parent)
+        ]
+
+    def from_text_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Split text into child chunks given as `(start, end)` character offsets into the text.
+
+        Args:
+            text (str): Input text to split.
+
+        Returns:
+            List[Tuple[int, int]]: List of child chunk offsets, `text[start:end]` being the chunk text.
+        """
+        return [
+            (parent_start + start, parent_start + end)
+            for parent_start, parent_end in self.parent_chunker.from_text_offsets(text)
+            for start, end in self.child_chunker.from_text_offsets(
+                text[parent_start:parent_end],
+            )
+        ]
+
+    def from_documents(self, documents: List[Document]) -> List[Document]:
+        """
+        Split documents into parent and child chunks.
+
+        Args:
+            documents (List[Document]): List of `Document` objects to split.
+
+        Returns:
+            List[Document]: List of chunked documents objects, the parent chunks followed by the child chunks.
+                Parents are the documents with an `is_parent_chunk` metadata, children the documents with
+                a `parent_id` metadata.
+        """
+        # Both levels are chunked in a single call each, so chunkers can batch across documents
+        parents = self.parent_chunker.from_documents(documents)
+        children = self.child_chunker.from_documents(parents)
+        parents_by_id = {parent.id_: parent for parent in parents}
+
+        for child in children:
+            parent = parents_by_id[child.metadata["ref_doc_id"]]
+            child.metadata = {
+                **{
+                    key: parent.metadata[key]
+                    for key in self.child_metadata_keys
+                    if key in parent.metadata
+                },
+                "parent_id": parent.id_,
+                "ref_doc_id": parent.metadata["ref_doc_id"],
+                "ref_doc_hash": parent.metadata["ref_doc_hash"],
+            }
+
+        for parent in parents:
+            parent.metadata["is_parent_chunk"] = True
+
+        return parents + children
@@ -0,0 +1,303 @@
+import re
+from typing import List, NamedTuple, Tuple
+
+from pineflow.core.document import Document
+from pineflow.core.text_chunkers.base import BaseTextChunker
+from pineflow.core.text_chunkers.sentence import SentenceChunker
+from pineflow.core.text_chunkers.utils import (
+    DEFAULT_ENCODING,
+    count_tokens,
+    strip_offsets,
+)
+
+_HEADING_RE = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_HEADING_PATH_SEPARATOR = " > "
+
+
+class _Block(NamedTuple):
+    """A paragraph, code block, table or heading line of a Markdown text."""
+
+    start: int
+    end: int
+    heading_path: Tuple[str, ...]
+
+
+class MarkdownChunker(BaseTextChunker):
+    """
+    Designed to split Markdown text (e.g. from `DoclingReader`) into chunks along its structure.
+
+    The text is parsed in a single pass into headings, paragraphs, fenced code blocks and tables, which are
+    never split unless larger than a chunk. Chunks are packed from whole blocks and start a new chunk at
+    every heading, unless the section fits in the chunk of its parent section. Each chunk carries the path
+    of headings it belongs to in its `heading_path` metadata, e.g. `"Installation > Requirements"`.
+
+    Blocks larger than a chunk are split by lines, and lines larger than a chunk by `SentenceChunker`.
+
+    Args:
+        chunk_size (int, optional): Size of each chunk. Default is `512`.
+        chunk_overlap (int, optional): Amount of overlap between the chunks of a line split by sentences.
+            Default is `0`.
+        encoding_name (str, optional): tiktoken encoding used to count tokens. Default is `cl100k_base`.
+        include_offsets (bool, optional): Whether chunk documents carry their `start_char_idx` and
+            `end_char_idx` offsets in metadata. Default is `False`.
+
+    Example:
+        .. code-block:: python
+
+            from pineflow.core.text_chunkers import MarkdownChunker
+
+            text_chunker = MarkdownChunker()
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 512,
+        chunk_overlap: int = 0,
+        encoding_name: str = DEFAULT_ENCODING,
+        include_offsets: bool = False,
+    ) -> None:
+        if chunk_overlap > chunk_size:
+            raise ValueError(
+                f"Got a larger `chunk_overlap` ({chunk_overlap}) than `chunk_size` "
+                f"({chunk_size}). `chunk_overlap` should be smaller.",
+            )
+
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.encoding_name = encoding_name
+        self.include_offsets = include_offsets
+
+        self._line_chunker = SentenceChunker(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            encoding_name=encoding_name,
+        )
+
+    def from_text(self, text: str) -> List[str]:
+        """
+        Split text into chunks.
+
+        Args:
+            text (str): Input Markdown text to split.
+
+        Returns:
+            List[str]: List of text chunks.
+
+        Example:
+            .. code-block:: python
+
+                with open("README.md") as f:
+                    chunks = text_chunker.from_text(f.read())
+        """
+        return [text[start:end] for start, end, _ in self._chunk(text)]
+
+    def from_text_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Split text into chunks given as `(start, end)` character offsets into the text.
+
+        Args:
+            text (str): Input Markdown text to split.
+
+        Returns:
+            List[Tuple[int, int]]: List of chunk offsets, `text[start:end]` being the chunk text.
+        """
+        return [(start, end) for start, end, _ in self._chunk(text)]
+
+    def from_documents(self, documents: List[Document]) -> List[Document]:
+        """
+        Split documents into chunks.
+
+        Args:
+            documents (List[Document]): List of `Document` objects to split.
+
+        Returns:
+            List[Document]: List of chunked documents objects.
+        """
+        chunks = []
+
+        for document in documents:
+            text = document.get_content()
+            text_chunks = self._chunk(text)
+
+            chunks.extend(
+                self._create_chunks(
+                    document,
+                    [text[start:end] for start, end, _ in text_chunks],
+                    [(start, end) for start, end, _ in text_chunks]
+                    if self.include_offsets
+                    else None,
+                    [
+                        {"heading_path": _HEADING_PATH_SEPARATOR.join(heading_path)}
+                        for _, _, heading_path in text_chunks
+                    ],
+                ),
+            )
+
+        return chunks
+
+    def _parse_blocks(self, text: str) -> List[_Block]:
+        """
+        Parse text into blocks in a single pass over its lines.
+
+        A heading line starts the block following it, so it is never separated from its first block.
+        """
+        blocks = []
+        headings: List[Tuple[int, str]] = []
+        heading_start = heading_end = None
+        block_start = block_end = None
+        in_table = False
+        fence = None
+        offset = 0
+
+        def open_block(line_start: int) -> None:
+            nonlocal block_start, heading_start
+            block_start = line_start if heading_start is None else heading_start
+            heading_start = None
+
+        def close_block() -> None:
+            nonlocal block_start, in_table
+            if block_start is not None:
+                blocks.append(
+                    _Block(block_start, block_end, tuple(t for _, t in headings))
+                )
+            block_start = None
+            in_table = False
+
+        def close_heading() -> None:
+            nonlocal heading_start
+            if heading_start is not None:
+                blocks.append(
+                    _Block(heading_start, heading_end, tuple(t for _, t in headings))
+                )
+            heading_start = None
+
+        for line in text.splitlines(keepends=True):
+            line_start, line_end = offset, offset + len(line.rstrip("\r\n"))
+            offset += len(line)
+            stripped = line.strip()
+
+            if fence is not None:
+                # Inside a code block, only the closing fence is meaningful
+                block_end = line_end
+                if stripped.startswith(fence) and stripped.strip(fence[0]) == "":
+                    close_block()
+                    fence = None
+                continue
+
+            fence_match = _FENCE_RE.match(line)
+            heading_match = _HEADING_RE.match(line.rstrip("\r\n"))
+
+            if fence_match:
+                close_block()
+                open_block(line_start)
+                fence = fence_match.group(1)
+                block_end = line_end
+            elif heading_match:
+                close_block()
+                close_heading()
+                level = len(heading_match.group(1))
+                while headings and headings[-1][0] >= level:
+                    headings.pop()
+                headings.append((level, (heading_match.group(2) or "").strip()))
+                heading_start, heading_end = line_start, line_end
+            elif not stripped:
+                close_block()
+            else:
+                is_table_row = stripped.startswith("|")
+                if block_start is not None and is_table_row != in_table:
+                    close_block()
+                if block_start is None:
+                    open_block(line_start)
+                    in_table = is_table_row
+                block_end = line_end
+
+        close_block()
+        close_heading()
+
+        return blocks
+
+    def _chunk(self, text: str) -> List[Tuple[int, int, Tuple[str, ...]]]:
+        """Chunk text into `(start, end, heading_path)` tuples."""
+        chunks = []
+        chunk_start = chunk_end = None
+        chunk_path: Tuple[str, ...] = ()
+        chunk_tokens = 0
+
+        for block in self._parse_blocks(text):
+            # One more token for the whitespace joining blocks, so a chunk fits
+            # when the sum of its block sizes is at most `chunk_size + 1`
+            block_tokens = (
+                count_tokens(text[block.start : block.end], self.encoding_name) + 1
+            )
+            in_section = block.heading_path[: len(chunk_path)] == chunk_path
+
+            if chunk_start is not None and (
+                chunk_tokens + block_tokens > self.chunk_size + 1 or not in_section
+            ):
+                chunks.append(
+                    (*strip_offsets(text, chunk_start, chunk_end), chunk_path)
+                )
+                chunk_start = None
+
+            if block_tokens > self.chunk_size + 1:
+                chunks.extend(
+                    (start, end, block.heading_path)
+                    for start, end in self._split_block(text, block.start, block.end)
+                )
+                continue
+
+            if chunk_start is None:
+                chunk_start = block.start
+                chunk_path = block.heading_path
+                chunk_tokens = 0
+            chunk_end = block.end
+            chunk_tokens += block_tokens
+
+        if chunk_start is not None:
+            chunks.append((*strip_offsets(text, chunk_start, chunk_end), chunk_path))
+
+        return chunks
+
+    def _split_block(self, text: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """Split a block larger than a chunk by lines, and lines larger than a chunk by sentences."""
+        chunks = []
+        chunk_start = None
+        chunk_end = start
+        chunk_tokens = 0
+        line_start = start
+
+        while line_start < end:
+            line_end = text.find("\n", line_start, end)
+            line_end = end if line_end < 0 else line_end + 1
+            line_tokens = count_tokens(text[line_start:line_end], self.encoding_name)
+
+            if line_tokens > self.chunk_size:
+                # The lines before a long line (e.g. its heading) are split by sentences along with it
+                split_start = line_start if chunk_start is None else chunk_start
+                chunks.extend(
+                    (split_start + offset_start, split_start + offset_end)
+                    for offset_start, offset_end in self._line_chunker.from_text_offsets(
+                        text[split_start:line_end],
+                    )
+                )
+                chunk_start = None
+            else:
+                if (
+                    chunk_start is not None
+                    and chunk_tokens + line_tokens > self.chunk_size
+                ):
+                    chunks.append(strip_offsets(text, chunk_start, chunk_end))
+                    chunk_start = None
+
+                if chunk_start is None:
+                    chunk_start, chunk_tokens = line_start, 0
+                chunk_end = line_end
+                chunk_tokens += line_tokens
+
+            line_start = line_end
+
+        if chunk_start is not None:
+            chunks.append(strip_offsets(text, chunk_start, chunk_end))
+
+        return [(s, e) for s, e in chunks if s < e]
@@ -1,12 +1,25 @@
 import re
-from typing import List, Literal, Tuple
+from itertools import accumulate
+from typing import List, Literal, Optional, Tuple
 
 import numpy as np
 from pineflow.core.document import Document
-from pineflow.core.embeddings import BaseEmbedding
+from pineflow.core.embeddings import BaseEmbedding, EmbeddingCache
 from pineflow.core.text_chunkers.base import BaseTextChunker
-from pineflow.core.utils.pairwise import cosine_similarity
-from pydantic.v1 import BaseModel
+from pineflow.core.text_chunkers.utils import (
+    DEFAULT_ENCODING,
+    count_tokens,
+    get_encoding,
+    split_offsets,
+)
+from pydantic.v1 import BaseModel, validator
+
+_DEFAULT_BREAKPOINT_THRESHOLD_AMOUNTS = {
+    "percentile": 95,
+    "standard_deviation": 3,
+    "interquartile": 1.5,
+    "gradient": 95,
+}
 
 
 class SemanticChunker(BaseTextChunker, BaseModel):
@@ -19,8 +32,30 @@ class SemanticChunker(BaseTextChunker, BaseModel):
     Args:
         embed_model (BaseEmbedding): Embedding model used for semantic chunking.
         buffer_size (int, optional): Size of the buffer for semantic chunking. Default is `1`.
-        breakpoint_threshold_amount (int, optional): Threshold percentage for detecting breakpoints. Default is `95`.
+        breakpoint_threshold_type (str, optional): How the distance threshold for detecting breakpoints is
+            computed from the distances between adjacent sentences. Default is `percentile`.
+
+            - `percentile`: the given percentile of the distances.
+            - `standard_deviation`: the mean plus the given number of standard deviations.
+            - `interquartile`: the mean plus the given number of interquartile ranges.
+            - `gradient`: the given percentile of the distance gradient, for highly correlated texts.
+
+        breakpoint_threshold_amount (float, optional): Threshold amount for detecting breakpoints. Defaults to
+            `95` for `percentile` and `gradient`, `3` for `standard_deviation` and `1.5` for `interquartile`.
         device (str, optional): Device to use for processing. Currently supports "cpu" and "cuda". Default is `cpu`.
+        embed_batch_size (int, optional): Maximum number of combined sentences per embedding call. Sentences of
+            all the documents chunked together are embedded in shared batches. Default is `512`.
+        include_offsets (bool, optional): Whether chunk documents are sliced from the document text and carry
+            their `start_char_idx` and `end_char_idx` offsets in metadata. Whitespace between sentences is then
+            kept as is. Default is `False`.
+        embed_cache (EmbeddingCache, optional): Cache of the combined sentence embeddings, so re-ingesting a
+            modified document only embeds the changed sentence windows. Default is `None`.
+        max_chunk_tokens (int, optional): Maximum number of tokens of a chunk, e.g. the input limit of the
+            downstream embedding model. Larger chunks are split between sentences, and longer sentences are
+            split by tokens. Default is `None`.
+        min_chunk_tokens (int, optional): Minimum number of tokens of a chunk. Smaller chunks are merged with
+            a neighbor, as long as the merged chunk fits `max_chunk_tokens`. Default is `None`.
+        encoding_name (str, optional): tiktoken encoding used to count tokens. Default is `cl100k_base`.
 
     Example:
         .. code-block:: python
@@ -34,69 +69,243 @@ class SemanticChunker(BaseTextChunker, BaseModel):
 
     embed_model: BaseEmbedding
     buffer_size: int = 1
-    breakpoint_threshold_amount: int = 95
+    breakpoint_threshold_type: Literal[
+        "percentile", "standard_deviation", "interquartile", "gradient"
+    ] = "percentile"
+    breakpoint_threshold_amount: Optional[float] = None
     device: Literal["cpu", "cuda"] = "cpu"
+    include_offsets: bool = False
+    embed_batch_size: int = 512
+    embed_cache: Optional[EmbeddingCache] = None
+    max_chunk_tokens: Optional[int] = None
+    min_chunk_tokens: Optional[int] = None
+    encoding_name: str = DEFAULT_ENCODING
 
     class Config:
         arbitrary_types_allowed = True
 
-    def _combine_sentences(self, sentences: List[dict]) -> List[dict]:
-        """Combine sentences with neighbors based on buffer size."""
-        for i in range(len(sentences)):
-            combined_sentence = ""
+    @validator("breakpoint_threshold_amount", always=True)
+    def _validate_breakpoint_threshold_amount(cls, v, values) -> float:
+        if v is None:
+            return _DEFAULT_BREAKPOINT_THRESHOLD_AMOUNTS[
+                values.get("breakpoint_threshold_type", "percentile")
+            ]
+        return v
+
+    @validator("min_chunk_tokens")
+    def _validate_min_chunk_tokens(cls, v, values) -> Optional[int]:
+        max_chunk_tokens = values.get("max_chunk_tokens")
+        if v is not None and max_chunk_tokens is not None and v > max_chunk_tokens:
+            raise ValueError(
+                f"Got a larger `min_chunk_tokens` ({v}) than `max_chunk_tokens` "
+                f"({max_chunk_tokens}). `min_chunk_tokens` should be smaller.",
+            )
+        return v
+
+    def _combine_sentences(self, sentences: List[str]) -> List[str]:
+        """Combine each sentence with its neighbors within the buffer size (sliding window)."""
+        return [
+            " ".join(sentences[max(i - self.buffer_size, 0) : i + 1 + self.buffer_size])
+            for i in range(len(sentences))
+        ]
 
-            # Add previous sentences based on buffer size
-            for j in range(i - self.buffer_size, i):
-                if j >= 0:
-                    combined_sentence += sentences[j]["sentence"] + " "
+    def _embed_sentences(self, sentences_list: List[List[str]]) -> List[np.ndarray]:
+        """
+        Embed the combined sentences of many texts in shared batches.
 
-            # Add the current sentence
-            combined_sentence += sentences[i]["sentence"]
+        Returns one `(n, d)` float32 matrix of embeddings per text, as views of a single matrix.
+        With `embed_cache`, only the combined sentences not cached yet are embedded.
+        """
+        combined_sentences = []
+        for sentences in sentences_list:
+            combined_sentences.extend(self._combine_sentences(sentences))
 
-            # Add next sentences based on buffer size
-            for j in range(i + 1, i + 1 + self.buffer_size):
-                if j < len(sentences):
-                    combined_sentence += " " + sentences[j]["sentence"]
+        model_name = getattr(
+            self.embed_model, "model_name", type(self.embed_model).__name__
+        )
+        if self.embed_cache is not None:
+            cached = self.embed_cache.get_many(model_name, combined_sentences)
+        else:
+            cached = [None] * len(combined_sentences)
+
+        missing = [i for i, embedding in enumerate(cached) if embedding is None]
+        hits = [i for i, embedding in enumerate(cached) if embedding is not None]
+
+        # Batches are copied into a preallocated matrix, not kept as lists of Python floats
+        matrix = None
+        if hits:
+            matrix = np.empty(
+                (len(combined_sentences), len(cached[hits[0]])),
+                dtype=np.float32,
+            )
+            matrix[hits] = np.stack([cached[i] for i in hits])
+
+        for i in range(0, len(missing), self.embed_batch_size):
+            indices = missing[i : i + self.embed_batch_size]
+            batch = np.asarray(
+                self.embed_model.get_texts_embedding(
+                    [combined_sentences[j] for j in indices],
+                ),
+                dtype=np.float32,
+            )
+
+            if matrix is None:
+                matrix = np.empty(
+                    (len(combined_sentences), batch.shape[1]),
+                    dtype=np.float32,
+                )
+            matrix[indices] = batch
+
+        if matrix is None:
+            matrix = np.empty((0, 0), dtype=np.float32)
+
+        if self.embed_cache is not None and missing:
+            self.embed_cache.put_many(
+                model_name,
+                [combined_sentences[i] for i in missing],
+                matrix[missing],
+            )
+
+        embeddings_list = []
+        offset = 0
+        for sentences in sentences_list:
+            embeddings_list.append(matrix[offset : offset + len(sentences)])
+            offset += len(sentences)
+
+        return embeddings_list
+
+    def _calculate_cosine_distances(self, embeddings: np.ndarray) -> np.ndarray:
+        """Cosine distances between adjacent rows of an `(n, d)` embedding matrix."""
+        if len(embeddings) < 2:
+            return np.empty(0, dtype=np.float32)
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        normalized = embeddings / np.where(norms == 0, 1, norms)
+
+        return 1 - np.einsum("ij,ij->i", normalized[:-1], normalized[1:])
+
+    def _calculate_breakpoint(self, distances: np.ndarray) -> List[int]:
+        if len(distances) == 0:
+            return []
+
+        amount = self.breakpoint_threshold_amount
+
+        if self.breakpoint_threshold_type == "standard_deviation":
+            distance_threshold = np.mean(distances) + amount * np.std(distances)
+        elif self.breakpoint_threshold_type == "interquartile":
+            q1, q3 = np.percentile(distances, [25, 75])
+            distance_threshold = np.mean(distances) + amount * (q3 - q1)
+        elif self.breakpoint_threshold_type == "gradient":
+            if len(distances) < 2:
+                return []
+            # Breakpoints are where distances rise sharply, not where they are high
+            distances = np.gradient(distances)
+            distance_threshold = np.percentile(distances, amount)
+        else:
+            distance_threshold = np.percentile(distances, amount)
+
+        return np.flatnonzero(distances > distance_threshold).tolist()
+
+    def _split_sentences(self, text: str) -> List[str]:
+        sentences = re.split(r"(?<=[.?!])\s+", text)
+
+        if self.max_chunk_tokens is None:
+            return sentences
+
+        # Sentences longer than a chunk are split by tokens, snapped to whole characters
+        encoding = get_encoding(self.encoding_name)
+        bounded_sentences = []
+
+        for sentence in sentences:
+            if count_tokens(sentence, self.encoding_name) <= self.max_chunk_tokens:
+                bounded_sentences.append(sentence)
+                continue
+
+            tokens = encoding.encode_ordinary(sentence)
+            _, token_offsets = encoding.decode_with_offsets(tokens)
+            starts = token_offsets[:: self.max_chunk_tokens]
+            bounded_sentences.extend(
+                sentence[start:end]
+                for start, end in zip(starts, [*starts[1:], len(sentence)])
+            )
+
+        return bounded_sentences
+
+    def _bound_groups(
+        self,
+        sentences: List[str],
+        groups: List[Tuple[int, int]],
+    ) -> List[Tuple[int, int]]:
+        """Split groups above `max_chunk_tokens` and merge groups below `min_chunk_tokens`, in a single pass."""
+        max_tokens = self.max_chunk_tokens or float("inf")
+        min_tokens = self.min_chunk_tokens or 0
+        # Sentence sizes are counted once, plus one token for the separator joining them in a chunk,
+        # so the size of `sentences[start:end]` is `cumulative_tokens[end] - cumulative_tokens[start] - 1`
+        cumulative_tokens = [
+            0,
+            *accumulate(count_tokens(s, self.encoding_name) + 1 for s in sentences),
+        ]
 
-            sentences[i]["combined_sentence"] = combined_sentence
+        bounded_groups: List[Tuple[int, int]] = []
+        last_tokens = 0
 
-        return sentences
+        def add_group(start: int, end: int) -> None:
+            nonlocal last_tokens
+            tokens = cumulative_tokens[end] - cumulative_tokens[start] - 1
 
-    def _calculate_cosine_distances(
-        self,
-        single_sentences_list: List[str],
-    ) -> Tuple[List[float], List[dict]]:
-        _sentences = [
-            {"sentence": x, "index": i} for i, x in enumerate(single_sentences_list)
-        ]
+            if (
+                bounded_groups
+                and (last_tokens < min_tokens or tokens < min_tokens)
+                and last_tokens + 1 + tokens <= max_tokens
+            ):
+                bounded_groups[-1] = (bounded_groups[-1][0], end)
+                last_tokens += 1 + tokens
+            else:
+                bounded_groups.append((start, end))
+                last_tokens = tokens
 
-        sentences = self._combine_sentences(_sentences)
-        embeddings = self.embed_model.get_texts_embedding(
-            [x["combined_sentence"] for x in sentences],
-        )
+        for start, end in groups:
+            group_start = start
+
+            for i in range(start + 1, end):
+                if (
+                    cumulative_tokens[i + 1] - cumulative_tokens[group_start] - 1
+                    > max_tokens
+                ):
+                    add_group(group_start, i)
+                    group_start = i
 
-        for i, sentence in enumerate(sentences):
-            sentence["combined_sentence_embedding"] = embeddings[i]
+            add_group(group_start, end)
 
-        distances = []
-        for i in range(len(sentences) - 1):
-            embedding_current = sentences[i]["combined_sentence_embedding"]
-            embedding_next = sentences[i + 1]["combined_sentence_embedding"]
+        return bounded_groups
 
-            similarity = cosine_similarity(embedding_current, embedding_next)
+    def _group_sentences(
+        self,
+        sentences: List[str],
+        embeddings: np.ndarray,
+    ) -> List[Tuple[int, int]]:
+        """Group sentences into chunks, given as `(start, end)` ranges of sentence indices."""
+        distances = self._calculate_cosine_distances(embeddings)
 
-            distance = 1 - similarity
-            distances.append(distance)
+        indices_above_thresh = self._calculate_breakpoint(distances)
 
-            # Store distance in the dictionary
-            sentences[i]["distance_to_next"] = distance
+        groups = []
+        start_index = 0
 
-        return distances, sentences
+        for index in indices_above_thresh:
+            groups.append((start_index, index + 1))
+
+            # Update the start index for the next group
+            start_index = index + 1
+
+        # The last group, if any sentences remain
+        if start_index < len(sentences):
+            groups.append((start_index, len(sentences)))
 
-    def _calculate_breakpoint(self, distances: List[float]) -> List:
-        distance_threshold = np.percentile(distances, self.breakpoint_threshold_amount)
+        if self.max_chunk_tokens is not None or self.min_chunk_tokens is not None:
+            groups = self._bound_groups(sentences, groups)
 
-        return [i for i, x in enumerate(distances) if x > distance_threshold]
+        return groups
 
     def from_text(self, text: str) -> List[str]:
         """
@@ -108,29 +317,48 @@ class SemanticChunker(BaseTextChunker, BaseModel):
         Returns:
             List[str]: List of text chunks.
         """
-        single_sentences_list = re.split(r"(?<=[.?!])\s+", text)
-        distances, sentences = self._calculate_cosine_distances(single_sentences_list)
+        sentences = self._split_sentences(text)
+        embeddings = self._embed_sentences([sentences])[0]
 
-        indices_above_thresh = self._calculate_breakpoint(distances)
+        return self._group_texts(
+            sentences, self._group_sentences(sentences, embeddings)
+        )
 
-        chunks = []
-        start_index = 0
+    def from_text_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Split text into chunks given as `(start, end)` character offsets into the text.
 
-        for index in indices_above_thresh:
-            # Slice the sentence_dicts from the current start index to the end index
-            group = sentences[start_index : index + 1]
-            combined_text = " ".join([d["sentence"] for d in group])
-            chunks.append(combined_text)
+        Args:
+            text (str): Input text to split.
 
-            # Update the start index for the next group
-            start_index = index + 1
+        Returns:
+            List[Tuple[int, int]]: List of chunk offsets, `text[start:end]` being the chunk text.
+        """
+        sentences = self._split_sentences(text)
+        embeddings = self._embed_sentences([sentences])[0]
 
-        # The last group, if any sentences remain
-        if start_index < len(sentences):
-            combined_text = " ".join([d["sentence"] for d in sentences[start_index:]])
-            chunks.append(combined_text)
+        return self._group_offsets(
+            text,
+            sentences,
+            self._group_sentences(sentences, embeddings),
+        )
 
-        return chunks
+    def _group_texts(
+        self,
+        sentences: List[str],
+        groups: List[Tuple[int, int]],
+    ) -> List[str]:
+        return [" ".join(sentences[start:end]) for start, end in groups]
+
+    def _group_offsets(
+        self,
+        text: str,
+        sentences: List[str],
+        groups: List[Tuple[int, int]],
+    ) -> List[Tuple[int, int]]:
+        offsets = split_offsets(text, sentences)
+
+        return [(offsets[start][0], offsets[end - 1][1]) for start, end in groups]
 
     def from_documents(self, documents: List[Document]) -> List[Document]:
         """
@@ -142,21 +370,32 @@ class SemanticChunker(BaseTextChunker, BaseModel):
         Returns:
             List[Document]: List of chunked documents objects.
         """
+        texts = [document.get_content() for document in documents]
+        sentences_list = [self._split_sentences(text) for text in texts]
+        # Sentences of every document are embedded together, so small documents share large batches
+        embeddings_list = self._embed_sentences(sentences_list)
         chunks = []
 
-        for document in documents:
-            texts = self.from_text(document.get_content())
-
-            for text in texts:
-                chunks.append(
-                    Document(
-                        text=text,
-                        metadata={
-                            **document.get_metadata(),
-                            "ref_doc_id": document.id_,
-                            "ref_doc_hash": document.hash,
-                        },
+        for document, text, sentences, embeddings in zip(
+            documents,
+            texts,
+            sentences_list,
+            embeddings_list,
+        ):
+            groups = self._group_sentences(sentences, embeddings)
+
+            if self.include_offsets:
+                offsets = self._group_offsets(text, sentences, groups)
+                chunks.extend(
+                    self._create_chunks(
+                        document,
+                        [text[start:end] for start, end in offsets],
+                        offsets,
                     ),
                 )
+            else:
+                chunks.extend(
+                    self._create_chunks(document, self._group_texts(sentences, groups)),
+                )
 
         return chunks
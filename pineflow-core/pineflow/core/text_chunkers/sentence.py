@@ -1,15 +1,18 @@
-from typing import List
+from typing import Iterable, Iterator, List, Literal, Tuple
 
 from pineflow.core.document import Document
 from pineflow.core.text_chunkers.base import BaseTextChunker
 from pineflow.core.text_chunkers.utils import (
+    DEFAULT_ENCODING,
+    count_tokens,
+    merge_split_offsets,
     merge_splits,
     split_by_char,
     split_by_fns,
     split_by_regex,
     split_by_sentence_tokenizer,
     split_by_sep,
-    tokenizer,
+    stream_merge_splits,
 )
 
 
@@ -22,6 +25,12 @@ class SentenceChunker(BaseTextChunker):
         chunk_size (int, optional): Size of each chunk. Default is `512`.
         chunk_overlap (int, optional): Amount of overlap between chunks. Default is `256`.
         separator (str, optional): Separator used for splitting text. Default is `" "`.
+        encoding_name (str, optional): tiktoken encoding used to count tokens. Default is `cl100k_base`.
+        include_offsets (bool, optional): Whether chunk documents are sliced from the document text and carry
+            their `start_char_idx` and `end_char_idx` offsets in metadata. Separators dropped between splits
+            are then kept in the chunk text. Default is `False`.
+        sentence_backend (str, optional): Sentence segmenter, `"punkt"` (NLTK Punkt, best quality) or `"regex"`
+            (splits after terminal punctuation, faster and without loading NLTK). Default is `"punkt"`.
 
     Example:
         .. code-block:: python
@@ -36,6 +45,9 @@ class SentenceChunker(BaseTextChunker):
         chunk_size: int = 512,
         chunk_overlap: int = 256,
         separator=" ",
+        encoding_name: str = DEFAULT_ENCODING,
+        include_offsets: bool = False,
+        sentence_backend: Literal["punkt", "regex"] = "punkt",
     ) -> None:
         if chunk_overlap > chunk_size:
             raise ValueError(
@@ -43,10 +55,21 @@ class SentenceChunker(BaseTextChunker):
                 f"({chunk_size}). `chunk_overlap` should be smaller.",
             )
 
+        if sentence_backend not in ("punkt", "regex"):
+            raise ValueError(
+                f"`sentence_backend` must be 'punkt' or 'regex', got '{sentence_backend}'.",
+            )
+
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.encoding_name = encoding_name
+        self.include_offsets = include_offsets
+        self.sentence_backend = sentence_backend
 
-        self._split_fns = [split_by_sep("\n\n\n"), split_by_sentence_tokenizer()]
+        self._split_fns = [
+            split_by_sep("\n\n\n"),
+            split_by_sentence_tokenizer(sentence_backend),
+        ]
         self._sub_split_fns = [
             split_by_regex("[^,.;？！]+[,.;？！]?"),
             split_by_sep(separator),
@@ -74,6 +97,48 @@ class SentenceChunker(BaseTextChunker):
 
         return merge_splits(splits, self.chunk_size, self.chunk_overlap)
 
+    def from_text_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Split text into chunks given as `(start, end)` character offsets into the text.
+
+        Args:
+            text (str): Input text to split.
+
+        Returns:
+            List[Tuple[int, int]]: List of chunk offsets, `text[start:end]` being the chunk text.
+        """
+        splits = self._split(text)
+
+        return merge_split_offsets(text, splits, self.chunk_size, self.chunk_overlap)
+
+    def stream_text(self, blocks: Iterable[str]) -> Iterator[str]:
+        """
+        Split incrementally read text into chunks, e.g. page by page or line by line.
+
+        Blocks are concatenated as is and chunks are yielded as soon as they are complete, the overlap being
+        carried across block boundaries, so arbitrarily large texts are chunked in bounded memory.
+        Chunk boundaries may differ from `from_text` around the points where the text is re-split.
+
+        Args:
+            blocks (Iterable[str]): Consecutive blocks of the text.
+
+        Yields:
+            str: Text chunks.
+
+        Example:
+            .. code-block:: python
+
+                with open("book.txt") as f:
+                    for chunk in text_chunker.stream_text(f):
+                        print(chunk)
+        """
+        return stream_merge_splits(
+            blocks,
+            self._split,
+            self.chunk_size,
+            self.chunk_overlap,
+        )
+
     def from_documents(self, documents: List[Document]) -> List[Document]:
         """
         Split documents into chunks.
@@ -87,24 +152,12 @@ class SentenceChunker(BaseTextChunker):
         chunks = []
 
         for document in documents:
-            texts = self.from_text(document.get_content())
-
-            for text in texts:
-                chunks.append(
-                    Document(
-                        text=text,
-                        metadata={
-                            **document.get_metadata(),
-                            "ref_doc_id": document.id_,
-                            "ref_doc_hash": document.hash,
-                        },
-                    ),
-                )
+            chunks.extend(self._chunk_document(document, self.include_offsets))
 
         return chunks
 
     def _split(self, text: str) -> List[dict]:
-        text_len = len(tokenizer(text))
+        text_len = count_tokens(text, self.encoding_name)
         if text_len <= self.chunk_size:
             return [{"text": text, "is_sentence": True, "token_size": text_len}]
 
@@ -116,7 +169,7 @@ class SentenceChunker(BaseTextChunker):
         )
 
         for text_split_by_fns in text_splits_by_fns:
-            split_len = len(tokenizer(text_split_by_fns))
+            split_len = count_tokens(text_split_by_fns, self.encoding_name)
             if split_len <= self.chunk_size:
                 text_splits.append(
                     {
@@ -1,13 +1,18 @@
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 
 from pineflow.core.document import Document
 from pineflow.core.text_chunkers.base import BaseTextChunker
 from pineflow.core.text_chunkers.utils import (
+    DEFAULT_ENCODING,
+    count_tokens,
+    get_encoding,
+    merge_split_offsets,
     merge_splits,
     split_by_char,
     split_by_fns,
     split_by_sep,
-    tokenizer,
+    stream_merge_splits,
+    strip_offsets,
 )
 
 
@@ -20,6 +25,13 @@ class TokenTextChunker(BaseTextChunker):
         chunk_size (int, optional): Size of each chunk. Default is `512`.
         chunk_overlap (int, optional): Amount of overlap between chunks. Default is `256`.
         separator (str, optional): Separators used for splitting into words. Default is `\\n\\n`.
+        encoding_name (str, optional): tiktoken encoding used to count tokens. Default is `cl100k_base`.
+        include_offsets (bool, optional): Whether chunk documents are sliced from the document text and carry
+            their `start_char_idx` and `end_char_idx` offsets in metadata. Separators dropped between splits
+            are then kept in the chunk text. Default is `False`.
+        token_window (bool, optional): Whether to chunk by token windows instead of separators. The text is
+            encoded once and sliced into windows of exactly `chunk_size` tokens, consecutive windows sharing
+            `chunk_overlap` tokens. Default is `False`.
 
     Example:
         .. code-block:: python
@@ -34,6 +46,9 @@ class TokenTextChunker(BaseTextChunker):
         chunk_size: int = 512,
         chunk_overlap: int = 256,
         separator="\n\n",
+        encoding_name: str = DEFAULT_ENCODING,
+        include_offsets: bool = False,
+        token_window: bool = False,
     ) -> None:
         if chunk_overlap > chunk_size:
             raise ValueError(
@@ -41,8 +56,16 @@ class TokenTextChunker(BaseTextChunker):
                 f"({chunk_size}). `chunk_overlap` should be smaller.",
             )
 
+        if token_window and chunk_overlap == chunk_size:
+            raise ValueError(
+                "`chunk_overlap` should be smaller than `chunk_size` with `token_window`.",
+            )
+
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.encoding_name = encoding_name
+        self.include_offsets = include_offsets
+        self.token_window = token_window
 
         self._split_fns = [split_by_sep(separator)]
 
@@ -65,10 +88,135 @@ class TokenTextChunker(BaseTextChunker):
                     "Pineflow is a data framework to load any data in one line of code and connect with AI applications."
                 )
         """
+        if self.token_window:
+            return [text[start:end] for start, end in self._token_window_offsets(text)]
+
         splits = self._split(text)
 
         return merge_splits(splits, self.chunk_size, self.chunk_overlap)
 
+    def from_text_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Split text into chunks given as `(start, end)` character offsets into the text.
+
+        Args:
+            text (str): Input text to split.
+
+        Returns:
+            List[Tuple[int, int]]: List of chunk offsets, `text[start:end]` being the chunk text.
+        """
+        if self.token_window:
+            return self._token_window_offsets(text)
+
+        splits = self._split(text)
+
+        return merge_split_offsets(text, splits, self.chunk_size, self.chunk_overlap)
+
+    def _token_window_offsets(self, text: str) -> List[Tuple[int, int]]:
+        encoding = get_encoding(self.encoding_name)
+        tokens = encoding.encode_ordinary(text)
+        # Character offset of each token, so windows cutting a multi-byte character are snapped to whole
+        # characters instead of being decoded with replacement characters
+        _, token_offsets = encoding.decode_with_offsets(tokens)
+        token_offsets.append(len(text))
+        chunks = []
+        start_token = 0
+
+        for window in self._token_windows(tokens):
+            start, end = strip_offsets(
+                text,
+                token_offsets[start_token],
+                token_offsets[start_token + len(window)],
+            )
+            start_token += self.chunk_size - self.chunk_overlap
+
+            if start < end:
+                chunks.append((start, end))
+
+        return chunks
+
+    def _stream_token_windows(self, blocks: Iterable[str]) -> Iterator[str]:
+        encoding = get_encoding(self.encoding_name)
+        stride = self.chunk_size - self.chunk_overlap
+        buffer = ""
+        carried_len = 0
+
+        for block in blocks:
+            buffer += block
+
+            # Wait for the buffer to double before encoding it again, keeping the total work linear
+            if len(buffer) < 2 * carried_len:
+                continue
+
+            tokens = encoding.encode_ordinary(buffer)
+            # Offsets are computed over the whole buffer, as decoding tokens cutting a multi-byte
+            # character fails, and windows are sliced from the buffer at whole characters
+            _, token_offsets = encoding.decode_with_offsets(tokens)
+            token_offsets.append(len(buffer))
+            start_token = 0
+
+            # The last `chunk_size` tokens may still change with the next block (e.g. a word cut in two),
+            # so windows reaching them are carried over
+            while start_token + 2 * self.chunk_size <= len(tokens):
+                start, end = strip_offsets(
+                    buffer,
+                    token_offsets[start_token],
+                    token_offsets[start_token + self.chunk_size],
+                )
+
+                if start < end:
+                    yield buffer[start:end]
+
+                start_token += stride
+
+            if start_token > 0:
+                buffer = buffer[token_offsets[start_token] :]
+
+            carried_len = len(buffer)
+
+        if buffer:
+            yield from self.from_text(buffer)
+
+    def _token_windows(self, tokens: List[int]) -> Iterator[List[int]]:
+        stride = self.chunk_size - self.chunk_overlap
+
+        for start in range(0, len(tokens), stride):
+            yield tokens[start : start + self.chunk_size]
+
+            if start + self.chunk_size >= len(tokens):
+                break
+
+    def stream_text(self, blocks: Iterable[str]) -> Iterator[str]:
+        """
+        Split incrementally read text into chunks, e.g. page by page or line by line.
+
+        Blocks are concatenated as is and chunks are yielded as soon as they are complete, the overlap being
+        carried across block boundaries, so arbitrarily large texts are chunked in bounded memory.
+        Chunk boundaries may differ from `from_text` around the points where the text is re-split.
+
+        Args:
+            blocks (Iterable[str]): Consecutive blocks of the text.
+
+        Yields:
+            str: Text chunks.
+
+        Example:
+            .. code-block:: python
+
+                with open("book.txt") as f:
+                    for chunk in text_chunker.stream_text(f):
+                        print(chunk)
+        """
+        if self.token_window:
+            return self._stream_token_windows(blocks)
+
+        return stream_merge_splits(
+            blocks,
+            self._split,
+            self.chunk_size,
+            self.chunk_overlap,
+        )
+
     def from_documents(self, documents: List[Document]) -> List[Document]:
         """
         Split documents into chunks.
@@ -82,24 +230,12 @@ class TokenTextChunker(BaseTextChunker):
         chunks = []
 
         for document in documents:
-            texts = self.from_text(document.get_content())
-
-            for text in texts:
-                chunks.append(
-                    Document(
-                        text=text,
-                        metadata={
-                            **document.get_metadata(),
-                            "ref_doc_id": document.id_,
-                            "ref_doc_hash": document.hash,
-                        },
-                    ),
-                )
+            chunks.extend(self._chunk_document(document, self.include_offsets))
 
         return chunks
 
     def _split(self, text: str) -> List[dict]:
-        text_len = len(tokenizer(text))
+        text_len = count_tokens(text, self.encoding_name)
         if text_len <= self.chunk_size:
             return [{"text": text, "is_sentence": True, "token_size": text_len}]
 
@@ -111,7 +247,7 @@ class TokenTextChunker(BaseTextChunker):
         )
 
         for text_split_by_fns in text_splits_by_fns:
-            split_len = len(tokenizer(text_split_by_fns))
+            split_len = count_tokens(text_split_by_fns, self.encoding_name)
             if split_len <= self.chunk_size:
                 text_splits.append(
                     {
@@ -1,7 +1,23 @@
-from typing import Callable, List, Tuple
+import re
+import threading
+from functools import lru_cache, partial
+from typing import Callable, Iterable, Iterator, List, Literal, Tuple
 
+DEFAULT_ENCODING = "cl100k_base"
 
-def tokenizer(text: str) -> List:
+# Only short texts (sentences, sub-sentence splits) repeat often enough to be worth memoizing
+_COUNT_CACHE_MAX_CHARS = 512
+
+# A sentence ends with terminal punctuation, optionally followed by closing quotes or brackets, then whitespace
+_SENTENCE_END_RE = re.compile(r"[.!?。！？][\"'”’)\]]*\s+")
+
+_punkt_tokenizer = None
+_punkt_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_encoding(encoding_name: str = DEFAULT_ENCODING):
+    """Get a tiktoken encoding, loaded once per process and shared across threads."""
     try:
         import tiktoken
     except ImportError:
@@ -9,55 +25,125 @@ def tokenizer(text: str) -> List:
             "tiktoken package not found, please install it with `pip install tiktoken`",
         )
 
-    enc = tiktoken.get_encoding("cl100k_base")
-    return enc.encode(text)
+    return tiktoken.get_encoding(encoding_name)
+
+
+def tokenizer(text: str, encoding_name: str = DEFAULT_ENCODING) -> List:
+    return get_encoding(encoding_name).encode(text)
+
+
+@lru_cache(maxsize=2**16)
+def _count_tokens_cached(text: str, encoding_name: str) -> int:
+    return len(get_encoding(encoding_name).encode_ordinary(text))
+
+
+def count_tokens(text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+    """
+    Count the tokens of a text.
+
+    Special tokens are encoded as ordinary text, and counts of short texts are memoized.
+    """
+    if len(text) <= _COUNT_CACHE_MAX_CHARS:
+        return _count_tokens_cached(text, encoding_name)
+
+    return len(get_encoding(encoding_name).encode_ordinary(text))
+
+
+def _split_by_sep(text: str, sep: str) -> List[str]:
+    return text.split(sep)
 
 
 def split_by_sep(sep) -> Callable[[str], List[str]]:
     """Split text by separator."""
-    return lambda text: text.split(sep)
+    # Split functions are built from module-level functions (not lambdas)
+    # so chunkers stay picklable and can be shipped to worker processes.
+    return partial(_split_by_sep, sep=sep)
 
 
 def split_by_regex(regex: str) -> Callable[[str], List[str]]:
     """Split text by regex."""
-    import re
-
-    return lambda text: re.findall(regex, text)
+    return partial(re.findall, regex)
 
 
 def split_by_char() -> Callable[[str], List[str]]:
     """Split text by character."""
-    return lambda text: list(text)
+    return list
 
 
-def split_by_sentence_tokenizer() -> Callable[[str], List[str]]:
-    try:
-        import nltk
-    except ImportError:
-        raise ImportError(
-            "nltk package not found, please install it with `pip install nltk`",
-        )
+def get_punkt_tokenizer():
+    """Get the Punkt sentence tokenizer, created on first use and shared by every chunker of the process."""
+    global _punkt_tokenizer
 
-    sentence_tokenizer = nltk.tokenize.PunktSentenceTokenizer()
-    return lambda text: _split_by_sentence_tokenizer(text, sentence_tokenizer)
+    if _punkt_tokenizer is None:
+        with _punkt_lock:
+            if _punkt_tokenizer is None:
+                try:
+                    import nltk
+                except ImportError:
+                    raise ImportError(
+                        "nltk package not found, please install it with `pip install nltk`",
+                    )
 
+                _punkt_tokenizer = nltk.tokenize.PunktSentenceTokenizer()
 
-def _split_by_sentence_tokenizer(text: str, sentence_tokenizer) -> List[str]:
+    return _punkt_tokenizer
+
+
+def sentence_spans(
+    text: str,
+    backend: Literal["punkt", "regex"] = "punkt",
+) -> Iterator[Tuple[int, int]]:
+    """
+    Lazily segment text into sentences, given as `(start, end)` character spans.
+
+    Args:
+        text (str): Input text to segment.
+        backend (str, optional): `"punkt"` for the NLTK Punkt tokenizer (best quality) or `"regex"`
+            for a faster segmenter splitting after terminal punctuation. Defaults to `"punkt"`.
+    """
+    if backend == "punkt":
+        yield from get_punkt_tokenizer().span_tokenize(text)
+        return
+
+    if backend != "regex":
+        raise ValueError(f"`backend` must be 'punkt' or 'regex', got '{backend}'.")
+
+    start = len(text) - len(text.lstrip())
+
+    for match in _SENTENCE_END_RE.finditer(text, start):
+        yield start, match.start() + len(match.group().rstrip())
+        start = match.end()
+
+    end = len(text.rstrip())
+    if start < end:
+        yield start, end
+
+
+def split_by_sentence_tokenizer(
+    backend: Literal["punkt", "regex"] = "punkt",
+) -> Callable[[str], List[str]]:
+    """Split text into sentences, see `sentence_spans` for the available backends."""
+    return partial(_split_by_sentence_tokenizer, backend=backend)
+
+
+def _split_by_sentence_tokenizer(text: str, backend: str) -> List[str]:
     """
     Get the spans and then return the sentences.
 
     Using the start index of each span
     Instead of using end, use the start of the next span
     """
-    spans = list(sentence_tokenizer.span_tokenize(text))
     sentences = []
-    for i, span in enumerate(spans):
-        start = span[0]
-        if i < len(spans) - 1:
-            end = spans[i + 1][0]
-        else:
-            end = len(text)
-        sentences.append(text[start:end])
+    prev_start = None
+
+    for start, _ in sentence_spans(text, backend):
+        if prev_start is not None:
+            sentences.append(text[prev_start:start])
+        prev_start = start
+
+    if prev_start is not None:
+        sentences.append(text[prev_start:])
+
     return sentences
 
 
@@ -82,68 +168,152 @@ def split_by_fns(  # noqa: RET503
                 return splits, False
 
 
-def merge_splits(splits: List[dict], chunk_size: int, chunk_overlap: int) -> List[str]:
-    """Merge splits into chunks."""
-    chunks: List[str] = []
-    cur_chunk: List[Tuple[str, int]] = []
+def merge_split_ranges(
+    splits: List[dict],
+    chunk_size: int,
+    chunk_overlap: int,
+) -> List[Tuple[int, int]]:
+    """
+    Merge splits into chunks, given as `(start, end)` ranges of split indices.
+
+    Chunks are contiguous runs of splits, the overlap with the previous chunk being its last splits.
+    """
+    ranges: List[Tuple[int, int]] = []
+    # The current chunk is `splits[cur_start:cur_end]`, splits are consumed with
+    # a cursor and the overlap is a range, so merging stays linear
+    cur_start = cur_end = 0
     cur_chunk_len = 0
-    last_chunk: List[Tuple[str, int]] = []
     new_chunk = True
 
-    def close_chunk() -> None:
-        nonlocal chunks, cur_chunk, last_chunk, cur_chunk_len, new_chunk
+    while cur_end < len(splits):
+        split_size = splits[cur_end]["token_size"]
 
-        chunks.append("".join([text for text, length in cur_chunk]))
-        last_chunk = cur_chunk
-        cur_chunk = []
-        cur_chunk_len = 0
-        new_chunk = True
+        if split_size > chunk_size:
+            raise ValueError("Got a split size that exceeded chunk size")
+
+        if cur_chunk_len + split_size > chunk_size and not new_chunk:
+            ranges.append((cur_start, cur_end))
 
-        # add overlap to the next chunk using previous chunk
-        if len(last_chunk) > 0:
-            last_index = len(last_chunk) - 1
+            # add overlap to the next chunk using the end of the previous chunk
+            cur_chunk_len = 0
+            last_start = cur_start
+            cur_start = cur_end
             while (
-                last_index >= 0
-                and cur_chunk_len + last_chunk[last_index][1] <= chunk_overlap
+                cur_start > last_start
+                and cur_chunk_len + splits[cur_start - 1]["token_size"] <= chunk_overlap
             ):
-                text, length = last_chunk[last_index]
-                cur_chunk_len += length
-                cur_chunk.insert(0, (text, length))
-                last_index -= 1
-
-    def postprocess_chunks(_chunks: List[str]) -> List[str]:
-        """Post-process chunks."""
-        post_chunks = []
-        for _chunk in _chunks:
-            stripped_chunk = _chunk.strip()
-            if stripped_chunk == "":
-                continue
-            post_chunks.append(stripped_chunk)
-        return post_chunks
-
-    while len(splits) > 0:
-        cur_split = splits[0]
-
-        if cur_split["token_size"] > chunk_size:
-            raise ValueError("Got a split size that exceeded chunk size")
+                cur_start -= 1
+                cur_chunk_len += splits[cur_start]["token_size"]
 
-        if cur_chunk_len + cur_split["token_size"] > chunk_size and not new_chunk:
-            close_chunk()
+            new_chunk = True
         else:
-            if (
-                cur_split["is_sentence"]
-                or cur_chunk_len + cur_split["token_size"] <= chunk_size
-                or new_chunk
-            ):  # If `new_chunk`, always add at least one split
-                cur_chunk_len += cur_split["token_size"]
-                cur_chunk.append((cur_split["text"], cur_split["token_size"]))
-                splits.pop(0)
-                new_chunk = False
-            else:
-                close_chunk()
+            # If `new_chunk`, always add at least one split
+            cur_chunk_len += split_size
+            cur_end += 1
+            new_chunk = False
 
     if not new_chunk:
-        chunk = "".join([text for text, length in cur_chunk])
-        chunks.append(chunk)
+        ranges.append((cur_start, cur_end))
+
+    return ranges
+
+
+def merge_splits(splits: List[dict], chunk_size: int, chunk_overlap: int) -> List[str]:
+    """Merge splits into chunks."""
+    chunks = []
+
+    for start, end in merge_split_ranges(splits, chunk_size, chunk_overlap):
+        chunk = "".join([split["text"] for split in splits[start:end]]).strip()
+
+        if chunk != "":
+            chunks.append(chunk)
+
+    return chunks
+
+
+def split_offsets(text: str, splits: List[str]) -> List[Tuple[int, int]]:
+    """Locate splits, taken in order from `text`, as `(start, end)` character offsets."""
+    offsets = []
+    cursor = 0
+
+    for split in splits:
+        start = text.find(split, cursor)
+        if start < 0:
+            raise ValueError(f"Split not found in text: {split[:50]!r}")
+
+        cursor = start + len(split)
+        offsets.append((start, cursor))
+
+    return offsets
+
+
+def strip_offsets(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Narrow `(start, end)` offsets so that `text[start:end]` has no leading or trailing whitespace."""
+    while start < end and text[start].isspace():
+        start += 1
+
+    while end > start and text[end - 1].isspace():
+        end -= 1
+
+    return start, end
+
+
+def merge_split_offsets(
+    text: str,
+    splits: List[dict],
+    chunk_size: int,
+    chunk_overlap: int,
+) -> List[Tuple[int, int]]:
+    """Merge splits of `text` into chunks, given as `(start, end)` character offsets into `text`."""
+    offsets = split_offsets(text, [split["text"] for split in splits])
+    chunks = []
+
+    for start, end in merge_split_ranges(splits, chunk_size, chunk_overlap):
+        start, end = strip_offsets(text, offsets[start][0], offsets[end - 1][1])
+
+        if start < end:
+            chunks.append((start, end))
+
+    return chunks
+
+
+def stream_merge_splits(
+    blocks: Iterable[str],
+    split_fn: Callable[[str], List[dict]],
+    chunk_size: int,
+    chunk_overlap: int,
+) -> Iterator[str]:
+    """
+    Merge splits of incrementally read text into chunks, yielding each chunk once it is complete.
+
+    Blocks are concatenated as is. Only the last two chunks of the text read so far are carried over
+    to the next block: the last one may be incomplete, and the end of the one before it depends on how
+    the last one is split. Memory is bounded by the block and chunk sizes.
+    """
+    buffer = ""
+    carried_len = 0
+
+    for block in blocks:
+        buffer += block
+
+        # Wait for the buffer to double before splitting it again, keeping the total work linear
+        if len(buffer) < 2 * carried_len:
+            continue
+
+        splits = split_fn(buffer)
+        ranges = merge_split_ranges(splits, chunk_size, chunk_overlap)
+
+        if len(ranges) > 2:
+            for start, end in ranges[:-2]:
+                chunk = "".join([split["text"] for split in splits[start:end]]).strip()
+
+                if chunk != "":
+                    yield chunk
+
+            offsets = split_offsets(buffer, [split["text"] for split in splits])
+            buffer = buffer[offsets[ranges[-2][0]][0] :]
+
+        carried_len = len(buffer)
 
-    return postprocess_chunks(chunks)
+    if buffer:
+        yield from merge_splits(split_fn(buffer), chunk_size, chunk_overlap)
@@ -0,0 +1,35 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+_worker_fn = None
+
+
+def _init_worker(fn: Callable) -> None:
+    global _worker_fn
+    _worker_fn = fn
+
+
+def call_worker(*args: Any) -> Any:
+    """Call the worker's copy of `fn` set up by `process_pool_executor`."""
+    return _worker_fn(*args)
+
+
+def process_pool_executor(fn: Callable, num_workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool where every worker holds its own copy of `fn`.
+
+    `fn` is pickled once per worker process (instead of once per task), so expensive
+    state such as tokenizers or models is loaded a single time per worker.
+    Submit work with `executor.submit(call_worker, *args)`.
+
+    Args:
+        fn (Callable): Picklable callable, e.g. a `TransformerComponent`.
+        num_workers (int): Number of worker processes.
+    """
+    return ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(fn,),
+    )
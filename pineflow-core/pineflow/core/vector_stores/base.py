@@ -1,7 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
-from pineflow.core.document.schema import Document
+from pineflow.core.document.schema import Document, DocumentWithScore
 
 
 class BaseVectorStore(ABC):
@@ -16,7 +17,7 @@ class BaseVectorStore(ABC):
         """Add documents to vector store."""
 
     @abstractmethod
-    def search_documents(self, query: str, top_k: int = 4) -> List[Document]:
+    def search_documents(self, query: str, top_k: int = 4) -> List[DocumentWithScore]:
         """Search for similar documents in the vector store based on the input query provided."""
 
     @abstractmethod
@@ -27,8 +28,94 @@ class BaseVectorStore(ABC):
     def get_all_documents(self, include_fields: List[str]) -> List[Document]:
         """Get all documents from vector store."""
 
+    def get_documents(self, ids: List[str]) -> List[Document]:
+        """
+        Get documents by ID, in the order of `ids`. Missing documents are skipped.
+
+        Vector stores should override it with a native lookup by ID. Defaults to filtering `get_all_documents`.
+        """
+        documents = {doc.id_: doc for doc in self.get_all_documents()}
+
+        return [documents[_id] for _id in ids if _id in documents]
+
+    def get_parent_documents(
+        self,
+        documents: List[Union[Document, DocumentWithScore]],
+    ) -> List[Document]:
+        """
+        Get the parent chunks of child chunks (e.g. search results), in a single batched lookup.
+
+        Parents are identified by the `parent_id` metadata set by `HierarchicalChunker`, deduplicated and
+        ordered by their first matching child. Documents without a parent are returned as is.
+
+        Args:
+            documents (List[Document]): Child chunks, or search results of child chunks.
+
+        Returns:
+            List[Document]: List of parent documents.
+
+        Example:
+            .. code-block:: python
+
+                children = vector_store.search_documents("What is Pineflow?", top_k=8)
+                parents = vector_store.get_parent_documents(children)
+        """
+        documents = [
+            doc.document if isinstance(doc, DocumentWithScore) else doc
+            for doc in documents
+        ]
+        unparented = {
+            doc.id_: doc for doc in documents if "parent_id" not in doc.metadata
+        }
+        ids = list(
+            dict.fromkeys(doc.metadata.get("parent_id", doc.id_) for doc in documents)
+        )
+
+        parents = {
+            doc.id_: doc
+            for doc in self.get_documents([_id for _id in ids if _id not in unparented])
+        }
+        parents.update(unparented)
+
+        return [parents[_id] for _id in ids if _id in parents]
+
+    def bulk_delete_documents(
+        self,
+        ids: List[str],
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Delete many documents from vector store, `batch_size` IDs per request.
+
+        Vector stores should override it with their native bulk deletion. Defaults to one
+        `delete_documents` call per batch of `1000` IDs.
+        """
+        batch_size = batch_size or 1000
+
+        for i in range(0, len(ids), batch_size):
+            self.delete_documents(ids[i : i + batch_size])
+
+    async def aadd_documents(self, documents: List[Document]) -> List[str]:
+        """Asynchronously add documents to vector store, `add_documents` runs in a thread executor unless overridden."""
+        return await asyncio.to_thread(self.add_documents, documents)
+
+    async def asearch_documents(
+        self, query: str, top_k: int = 4
+    ) -> List[DocumentWithScore]:
+        """Asynchronously search for similar documents, `search_documents` runs in a thread executor unless overridden."""
+        return await asyncio.to_thread(self.search_documents, query, top_k)
+
+    async def adelete_documents(self, ids: List[str]) -> None:
+        """Asynchronously delete documents, `delete_documents` runs in a thread executor unless overridden."""
+        await asyncio.to_thread(self.delete_documents, ids)
+
     def get_all_document_hashes(self) -> Tuple[List[str], List[str], List[str]]:
-        """Get all ref hashes from vector store."""
+        """
+        Get all ref hashes from vector store.
+
+        Vector stores should override it to fetch only the `hash` and `ref_doc_hash` metadata fields
+        instead of whole documents.
+        """
         hits = self.get_all_documents()
 
         ids = [doc.id_ for doc in hits]
@@ -36,3 +123,58 @@ class BaseVectorStore(ABC):
         ref_hashes = [doc.metadata.get("ref_doc_hash") for doc in hits]
 
         return ids, hashes, ref_hashes
+
+    def exists_hashes(self, hashes: List[str], parent_level: bool = False) -> Set[str]:
+        """
+        Get which of the given hashes are already stored in the vector store.
+
+        Args:
+            hashes (List[str]): Document hashes to look up.
+            parent_level (bool, optional): Whether to match the parent document hash (`ref_doc_hash`),
+                falling back to the document own hash when `ref_doc_hash` is missing.
+                Defaults to `False` (match the document own hash).
+
+        Returns:
+            Set[str]: The subset of `hashes` found in the vector store.
+        """
+        _, doc_hashes, ref_hashes = self.get_all_document_hashes()
+
+        if parent_level:
+            doc_hashes = [
+                ref_hash if ref_hash is not None else _hash
+                for _hash, ref_hash in zip(doc_hashes, ref_hashes)
+            ]
+
+        return set(hashes).intersection(doc_hashes)
+
+    def get_ids_by_hashes(
+        self,
+        hashes: List[str],
+        parent_level: bool = False,
+    ) -> Dict[str, List[str]]:
+        """
+        Get the IDs of the stored documents matching each of the given hashes.
+
+        Vector stores should override it with a native filter on the hash metadata fields.
+        Defaults to filtering `get_all_document_hashes`.
+
+        Args:
+            hashes (List[str]): Document hashes to look up.
+            parent_level (bool, optional): Whether to match the parent document hash (`ref_doc_hash`),
+                falling back to the document own hash when `ref_doc_hash` is missing.
+                Defaults to `False` (match the document own hash).
+
+        Returns:
+            Dict[str, List[str]]: The IDs of the stored documents of each hash found in the vector store.
+        """
+        hashes = set(hashes)
+        ids_by_hash = {}
+
+        for _id, _hash, ref_hash in zip(*self.get_all_document_hashes()):
+            if parent_level and ref_hash is not None:
+                _hash = ref_hash
+
+            if _hash in hashes:
+                ids_by_hash.setdefault(_hash, []).append(_id)
+
+        return ids_by_hash
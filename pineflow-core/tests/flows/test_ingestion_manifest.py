@@ -0,0 +1,124 @@
+import asyncio
+from typing import List
+
+import pytest
+from pineflow.core.document import Document
+from pineflow.core.flows import IngestionFlow, IngestionManifest
+from pineflow.core.flows.ingestion_flow import DocStrategy
+from pineflow.core.vector_stores import BaseVectorStore
+
+
+class InMemoryVectorStore(BaseVectorStore):
+    """Vector store keeping documents in a dict, with their hash metadata."""
+
+    def __init__(self) -> None:
+        self.documents = {}
+
+    def add_documents(self, documents: List[Document]) -> List[str]:
+        for doc in documents:
+            self.documents[doc.id_] = Document(
+                id_=doc.id_,
+                text=doc.get_content(),
+                metadata={**doc.get_metadata(), "hash": doc.hash},
+            )
+
+        return [doc.id_ for doc in documents]
+
+    def search_documents(self, query: str, top_k: int = 4) -> list:
+        return []
+
+    def delete_documents(self, ids: List[str]) -> None:
+        for _id in ids:
+            self.documents.pop(_id, None)
+
+    def get_all_documents(self, include_fields: List[str] = None) -> List[Document]:
+        return list(self.documents.values())
+
+
+def ingest(flow: IngestionFlow, documents: List[Document], mode: str) -> None:
+    if mode == "stream":
+        for _ in flow.stream(documents, batch_size=1):
+            pass
+    elif mode == "arun":
+        asyncio.run(flow.arun(documents))
+    else:
+        flow.run(documents)
+
+
+def manifest_flow(
+    vector_store: BaseVectorStore,
+    manifest: IngestionManifest,
+    post_transformer: bool,
+) -> IngestionFlow:
+    return IngestionFlow(
+        transformers=[],
+        vector_store=vector_store,
+        doc_strategy=DocStrategy.DUPLICATE_AND_DELETE,
+        post_transformer=post_transformer,
+        manifest=manifest,
+    )
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    manifest = IngestionManifest(str(tmp_path / "manifest.db"))
+    yield manifest
+    manifest.close()
+
+
+@pytest.mark.parametrize("mode", ["run", "stream", "arun"])
+@pytest.mark.parametrize("post_transformer", [False, True])
+def test_manifest_enabled_on_populated_store(manifest, mode, post_transformer):
+    def documents():
+        return [
+            Document(text="alpha", metadata={"source": "a.txt"}),
+            Document(text="beta", metadata={"source": "b.txt"}),
+        ]
+
+    vector_store = InMemoryVectorStore()
+    ingest(
+        IngestionFlow(
+            transformers=[],
+            vector_store=vector_store,
+            doc_strategy=DocStrategy.DUPLICATE_AND_DELETE,
+            post_transformer=post_transformer,
+        ),
+        documents(),
+        mode,
+    )
+    stored_ids = set(vector_store.documents)
+
+    # Documents skipped by de-dup are recorded with the IDs of their stored copies
+    for _ in range(2):
+        ingest(
+            manifest_flow(vector_store, manifest, post_transformer), documents(), mode
+        )
+
+        assert set(vector_store.documents) == stored_ids
+
+    records = manifest.get_many([("a.txt", 0), ("b.txt", 0)])
+    assert {
+        _id for record in records.values() for _id in record.chunk_ids
+    } == stored_ids
+
+
+@pytest.mark.parametrize("mode", ["run", "stream", "arun"])
+@pytest.mark.parametrize("post_transformer", [False, True])
+def test_manifest_identical_sourceless_documents(manifest, mode, post_transformer):
+    def documents():
+        return [Document(text="twin"), Document(text="twin"), Document(text="other")]
+
+    vector_store = InMemoryVectorStore()
+
+    for _ in range(3):
+        ingest(
+            manifest_flow(vector_store, manifest, post_transformer), documents(), mode
+        )
+
+        assert sorted(doc.text for doc in vector_store.documents.values()) == [
+            "other",
+            "twin",
+        ]
+
+    record = manifest.get((documents()[0].hash, 0))
+    assert [vector_store.documents[_id].text for _id in record.chunk_ids] == ["twin"]
@@ -1,7 +1,7 @@
 import logging
 import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from pineflow.core.document import Document
 from pineflow.core.readers import BaseReader
@@ -22,6 +22,18 @@ class PDFReader(BaseReader):
         Returns:
             List[Document]: A list of `Document` objects loaded from the file.
         """
+        return list(self.lazy_load(input_file))
+
+    def lazy_load(self, input_file: str) -> Iterator[Document]:
+        """
+        Lazily loads data from the specified file, one page at a time.
+
+        Args:
+            input_file (str): File path to load.
+
+        Yields:
+            Document: A `Document` object for each page of the file.
+        """
         try:
             import pypdf  # noqa: F401
 
@@ -36,10 +48,8 @@ class PDFReader(BaseReader):
         input_file = str(Path(input_file).resolve())
         pdf_loader = pypdf.PdfReader(input_file)
 
-        return [
-            Document(
+        for page_number, page in enumerate(pdf_loader.pages):
+            yield Document(
                 text=page.extract_text().strip(),
                 metadata={"source": input_file, "page": page_number},
             )
-            for page_number, page in enumerate(pdf_loader.pages)
-        ]
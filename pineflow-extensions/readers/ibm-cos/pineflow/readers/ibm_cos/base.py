@@ -2,7 +2,7 @@ import os
 
 # import re
 import tempfile
-from typing import List
+from typing import Iterator, List
 
 from pineflow.core.document import Document
 from pineflow.core.readers import BaseReader, DirectoryReader
@@ -51,6 +51,15 @@ class IBMCOSReader(BaseReader):
 
     def load_data(self) -> List[Document]:
         """Loads data from the specified bucket."""
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """
+        Lazily loads data from the specified bucket.
+
+        Objects are downloaded and read one at a time, so only a single object is held on disk and
+        its documents are yielded as they are read (e.g. page by page for PDF files).
+        """
         ibm_s3 = self._ibm_boto3.resource(
             "s3",
             ibm_api_key_id=self.ibm_api_key_id,
@@ -60,13 +69,18 @@ class IBMCOSReader(BaseReader):
         )
 
         bucket = ibm_s3.Bucket(self.bucket)
+        directory_reader = DirectoryReader(recursive=True)
+
+        for obj in bucket.objects.filter(Prefix=""):
+            # Skip objects the directory reader would ignore, without downloading them
+            if os.path.splitext(obj.key)[1] not in directory_reader.required_exts:
+                continue
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for obj in bucket.objects.filter(Prefix=""):
+            with tempfile.TemporaryDirectory() as temp_dir:
                 file_path = f"{temp_dir}/{obj.key}"
                 os.makedirs(os.path.dirname(file_path), exist_ok=True)
                 ibm_s3.meta.client.download_file(self.bucket, obj.key, file_path)
 
-            # s3_source = re.sub(r"^(https?)://", "", self.s3_endpoint_url)
+                # s3_source = re.sub(r"^(https?)://", "", self.s3_endpoint_url)
 
-            return DirectoryReader(input_dir=temp_dir).load_data()
+                yield from directory_reader.lazy_load(temp_dir)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from logging import getLogger
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from pineflow.core.document import Document
 from pineflow.core.readers import BaseReader
@@ -72,11 +72,22 @@ class WatsonDiscoveryReader(BaseReader):
 
                 docs = discovery_reader.load_data()
         """
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """
+        Lazily loads documents from Watson Discovery, one query page of `batch_size` documents at a time.
+
+        Example:
+            .. code-block:: python
+
+                for doc in discovery_reader.lazy_load():
+                    print(doc.id_)
+        """
         from ibm_watson.discovery_v2 import QueryLargePassages
 
         last_batch_size = self.batch_size
         offset_len = 0
-        documents = []
         return_fields = [
             "extracted_metadata.filename",
             "extracted_metadata.file_type",
@@ -111,21 +122,15 @@ class WatsonDiscoveryReader(BaseReader):
                         self._get_nested_value(doc, self.pre_additional_data_field),
                     )
 
-            documents.extend(
-                [
-                    Document(
-                        id_=doc["document_id"],
-                        text="\n".join(doc["text"]),
-                        metadata={
-                            "collection_id": doc["result_metadata"]["collection_id"],
-                        }
-                        | doc["extracted_metadata"],
-                    )
-                    for doc in results_documents
-                ],
-            )
-
-        return documents
+            for doc in results_documents:
+                yield Document(
+                    id_=doc["document_id"],
+                    text="\n".join(doc["text"]),
+                    metadata={
+                        "collection_id": doc["result_metadata"]["collection_id"],
+                    }
+                    | doc["extracted_metadata"],
+                )
 
     @staticmethod
     def _get_nested_value(d, key_path, separator: Optional[str] = "."):
@@ -1,6 +1,6 @@
 import uuid
 from logging import getLogger
-from typing import List, Literal
+from typing import Dict, List, Literal, Set, Tuple
 
 from pineflow.core.document import Document, DocumentWithScore
 from pineflow.core.embeddings import BaseEmbedding
@@ -14,6 +14,11 @@ class ChromaVectorStore(BaseVectorStore):
     Chroma is the AI-native open-source vector database.
     Embeddings are stored within a ChromaDB collection.
 
+    Parent chunks of `HierarchicalChunker` (documents with an `is_parent_chunk` metadata) are not vectorized,
+    and are kept in a separate `<collection_name>-parents` collection, as Chroma requires an embedding for
+    every record of a collection. It is created when the first parent chunk is stored, and parents are only
+    looked up by ID, e.g. with `get_parent_documents`.
+
     Args:
         embed_model (BaseEmbedding): Embedding model used to compute vectors.
         collection_name (str, optional): Name of the ChromaDB collection.
@@ -52,10 +57,29 @@ class ChromaVectorStore(BaseVectorStore):
             embedding_function=None,
             metadata={"hnsw:space": distance_strategy},
         )
+        self._parent_collection_name = f"{collection_name}-parents"
+        self._parent_collection = None
+
+        # Parent chunks may have been stored by another instance sharing the client
+        if self._parent_collection_name in [
+            collection if isinstance(collection, str) else collection.name
+            for collection in self._client.list_collections()
+        ]:
+            self._parent_collection = self._client.get_collection(
+                name=self._parent_collection_name,
+                embedding_function=None,
+            )
+
+    def _collections(self) -> list:
+        """The ChromaDB collection, followed by the parents collection once it exists."""
+        if self._parent_collection is None:
+            return [self._collection]
+
+        return [self._collection, self._parent_collection]
 
     def add_documents(self, documents: List[Document]) -> List:
         """
-        Add documents to the ChromaDB collection.
+        Add documents to the ChromaDB collection, replacing the stored documents with the same IDs.
 
         Args:
             documents (List[Document]): List of documents to add to the collection.
@@ -64,8 +88,15 @@ class ChromaVectorStore(BaseVectorStore):
         metadatas = []
         ids = []
         chroma_documents = []
+        parent_documents = []
+        added_ids = []
 
         for doc in documents:
+            if doc.metadata.get("is_parent_chunk"):
+                parent_documents.append(doc)
+                added_ids.append(doc.id_)
+                continue
+
             metadatas.append({**doc.get_metadata(), "hash": doc.hash})
 
             embeddings.append(
@@ -74,16 +105,35 @@ class ChromaVectorStore(BaseVectorStore):
                 else self._embed_model.get_text_embedding(doc.get_content()),
             )
             ids.append(doc.id_ if doc.id_ else str(uuid.uuid4()))
+            added_ids.append(ids[-1])
             chroma_documents.append(doc.get_content())
 
-        self._collection.add(
-            embeddings=embeddings,
-            ids=ids,
-            metadatas=metadatas,
-            documents=chroma_documents,
-        )
+        if ids:
+            self._collection.upsert(
+                embeddings=embeddings,
+                ids=ids,
+                metadatas=metadatas,
+                documents=chroma_documents,
+            )
 
-        return ids
+        if parent_documents:
+            if self._parent_collection is None:
+                # Records of the parents collection get a placeholder embedding, it is never queried by similarity
+                self._parent_collection = self._client.get_or_create_collection(
+                    name=self._parent_collection_name,
+                    embedding_function=None,
+                )
+
+            self._parent_collection.upsert(
+                embeddings=[[0.0]] * len(parent_documents),
+                ids=[doc.id_ for doc in parent_documents],
+                metadatas=[
+                    {**doc.get_metadata(), "hash": doc.hash} for doc in parent_documents
+                ],
+                documents=[doc.get_content() for doc in parent_documents],
+            )
+
+        return added_ids
 
     def search_documents(self, query: str, top_k: int = 4) -> List[DocumentWithScore]:
         """
@@ -123,7 +173,8 @@ class ChromaVectorStore(BaseVectorStore):
         Args:
             ids (List[str], optional): List of `Document` IDs to delete. Defaults to `None`.
         """
-        self._collection.delete(ids=ids)
+        for collection in self._collections():
+            collection.delete(ids=ids)
 
     def get_all_documents(self, include_fields: List[str] = None) -> List[Document]:
         """Get all documents from vector store."""
@@ -136,15 +187,145 @@ class ChromaVectorStore(BaseVectorStore):
             "embeddings": "embedding",
         }
 
-        data = self._collection.get(include=include)
-        num_items = len(data["ids"])
+        documents = []
 
-        return [
-            Document(
-                **{
-                    mapped_key: data[original_key][i]
-                    for original_key, mapped_key in field_map.items()
-                },
+        for collection in self._collections():
+            # Parent chunks only have a placeholder embedding
+            data = collection.get(
+                include=include
+                if collection is self._collection
+                else [field for field in include if field != "embeddings"],
             )
-            for i in range(num_items)
-        ]
+            num_items = len(data["ids"])
+
+            documents.extend(
+                Document(
+                    **{
+                        mapped_key: data[original_key][i]
+                        for original_key, mapped_key in field_map.items()
+                        if data.get(original_key) is not None
+                    },
+                )
+                for i in range(num_items)
+            )
+
+        return documents
+
+    def get_documents(self, ids: List[str]) -> List[Document]:
+        """
+        Get documents by ID from the ChromaDB collection and its parents collection, without their embeddings.
+
+        Args:
+            ids (List[str]): List of documents IDs to get. Missing documents are skipped.
+        """
+        if not ids:
+            return []
+
+        documents = {}
+
+        for collection in self._collections():
+            data = collection.get(ids=ids, include=["documents", "metadatas"])
+            documents.update(
+                (_id, Document(id_=_id, text=text, metadata=metadata))
+                for _id, text, metadata in zip(
+                    data["ids"], data["documents"], data["metadatas"]
+                )
+            )
+
+        return [documents[_id] for _id in ids if _id in documents]
+
+    def get_all_document_hashes(self) -> Tuple[List[str], List[str], List[str]]:
+        """Get all document IDs, hashes and ref hashes, fetching only the metadatas."""
+        ids = []
+        hashes = []
+        ref_hashes = []
+
+        for collection in self._collections():
+            data = collection.get(include=["metadatas"])
+
+            ids.extend(data["ids"])
+            hashes.extend(metadata.get("hash") for metadata in data["metadatas"])
+            ref_hashes.extend(
+                metadata.get("ref_doc_hash") for metadata in data["metadatas"]
+            )
+
+        return ids, hashes, ref_hashes
+
+    def exists_hashes(self, hashes: List[str], parent_level: bool = False) -> Set[str]:
+        """
+        Get which of the given hashes are already stored in the ChromaDB collection.
+
+        Uses a `where` filter on the hash metadata fields and fetches only the matching metadatas.
+
+        Args:
+            hashes (List[str]): Document hashes to look up.
+            parent_level (bool, optional): Whether to match the parent document hash (`ref_doc_hash`),
+                falling back to the document own hash when `ref_doc_hash` is missing. Defaults to `False`.
+        """
+        hashes = list(set(hashes))
+
+        if not hashes:
+            return set()
+
+        where = {"hash": {"$in": hashes}}
+        if parent_level:
+            where = {"$or": [where, {"ref_doc_hash": {"$in": hashes}}]}
+
+        stored_hashes = set()
+
+        for collection in self._collections():
+            data = collection.get(where=where, include=["metadatas"])
+
+            if parent_level:
+                stored_hashes.update(
+                    metadata.get("ref_doc_hash", metadata.get("hash"))
+                    for metadata in data["metadatas"]
+                )
+            else:
+                stored_hashes.update(
+                    metadata.get("hash") for metadata in data["metadatas"]
+                )
+
+        return set(hashes).intersection(stored_hashes)
+
+    def get_ids_by_hashes(
+        self,
+        hashes: List[str],
+        parent_level: bool = False,
+    ) -> Dict[str, List[str]]:
+        """
+        Get the IDs of the documents of the ChromaDB collection matching each of the given hashes.
+
+        Uses a `where` filter on the hash metadata fields and fetches only the matching metadatas.
+
+        Args:
+            hashes (List[str]): Document hashes to look up.
+            parent_level (bool, optional): Whether to match the parent document hash (`ref_doc_hash`),
+                falling back to the document own hash when `ref_doc_hash` is missing. Defaults to `False`.
+        """
+        hash_set = set(hashes)
+        hashes = list(hash_set)
+
+        if not hashes:
+            return {}
+
+        where = {"hash": {"$in": hashes}}
+        if parent_level:
+            where = {"$or": [where, {"ref_doc_hash": {"$in": hashes}}]}
+
+        ids_by_hash = {}
+
+        for collection in self._collections():
+            data = collection.get(where=where, include=["metadatas"])
+
+            for _id, metadata in zip(data["ids"], data["metadatas"]):
+                _hash = (
+                    metadata.get("ref_doc_hash", metadata.get("hash"))
+                    if parent_level
+                    else metadata.get("hash")
+                )
+
+                if _hash in hash_set:
+                    ids_by_hash.setdefault(_hash, []).append(_id)
+
+        return ids_by_hash
@@ -1,6 +1,6 @@
 import uuid
 from logging import getLogger
-from typing import List, Literal
+from typing import Dict, Iterator, List, Literal, Optional, Set, Tuple
 
 from pineflow.core.document import Document, DocumentWithScore
 from pineflow.core.embeddings import BaseEmbedding
@@ -125,7 +125,8 @@ class ElasticsearchVectorStore(BaseVectorStore):
         create_index_if_not_exists: bool = True,
     ) -> List[str]:
         """
-        Add documents to the Elasticsearch index.
+        Add documents to the Elasticsearch index. Parent chunks marked with an `is_parent_chunk` metadata
+        are indexed without a vector.
 
         Args:
             documents (List[Document]): List of documents to add to the index.
@@ -140,18 +141,23 @@ class ElasticsearchVectorStore(BaseVectorStore):
             _id = doc.id_ if doc.id_ else str(uuid.uuid4())
             _metadata = {**doc.get_metadata(), "hash": doc.hash}
             _metadata_mapping = self._dynamic_metadata_mapping(_metadata)
-            vector_store_data.append(
-                {
-                    "_index": self.index_name,
-                    "_id": _id,
-                    self.text_field: doc.get_content(),
-                    self.vector_field: doc.embedding
+            _data = {
+                "_index": self.index_name,
+                "_id": _id,
+                self.text_field: doc.get_content(),
+                "metadata": _metadata,
+                **_metadata_mapping,
+            }
+
+            # Parent chunks (see `HierarchicalChunker`) are indexed without a vector, so kNN search skips them
+            if not doc.metadata.get("is_parent_chunk"):
+                _data[self.vector_field] = (
+                    doc.embedding
                     if doc.embedding
-                    else self._embed_model.get_text_embedding(doc.get_content()),
-                    "metadata": _metadata,
-                    **_metadata_mapping,
-                },
-            )
+                    else self._embed_model.get_text_embedding(doc.get_content())
+                )
+
+            vector_store_data.append(_data)
 
         self._es_bulk(
             self._client,
@@ -222,18 +228,71 @@ class ElasticsearchVectorStore(BaseVectorStore):
         Args:
             ids (List[str]): List of documents IDs to delete.
         """
-        for id in ids:
-            self._client.delete(index=self.index_name, id=id)
+        self.bulk_delete_documents(ids)
 
-    def get_all_documents(self, include_fields: List[str] = []) -> List[Document]:
-        """Get all documents from vector store."""
-        es_query = {"query": {"match_all": {}}}
+    def bulk_delete_documents(
+        self,
+        ids: List[str],
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Delete documents from the Elasticsearch index with bulk delete actions.
 
-        if len(include_fields):
-            es_query["_source"] = include_fields
+        Missing documents are ignored.
+
+        Args:
+            ids (List[str]): List of documents IDs to delete.
+            batch_size (int, optional): Number of delete actions per bulk request. Defaults to the store `batch_size`.
+        """
+        self._es_bulk(
+            self._client,
+            (
+                {"_op_type": "delete", "_index": self.index_name, "_id": _id}
+                for _id in ids
+            ),
+            chunk_size=batch_size or self.batch_size,
+            ignore_status=404,
+            refresh=True,
+        )
+
+    def get_documents(self, ids: List[str]) -> List[Document]:
+        """
+        Get documents by ID from the Elasticsearch index with a multi get request, without their embeddings.
+
+        Args:
+            ids (List[str]): List of documents IDs to get. Missing documents are skipped.
+        """
+        if not ids:
+            return []
 
         from elasticsearch import NotFoundError
 
+        try:
+            data = self._client.mget(
+                index=self.index_name,
+                ids=ids,
+                _source_excludes=[self.vector_field],
+            )
+        except NotFoundError as e:
+            if e.status_code == 404 and e.error == "index_not_found_exception":
+                return []
+            else:
+                raise
+
+        return [
+            Document(
+                id_=doc["_id"],
+                text=doc["_source"].get(self.text_field, ""),
+                metadata=doc["_source"].get("metadata", {}),
+            )
+            for doc in data["docs"]
+            if doc.get("found")
+        ]
+
+    def _scroll_hits(self, es_query: dict) -> Iterator[dict]:
+        """Scroll through every hit matching the query."""
+        from elasticsearch import NotFoundError
+
         try:
             data = self._client.search(
                 index=self.index_name,
@@ -243,39 +302,170 @@ class ElasticsearchVectorStore(BaseVectorStore):
             )
         except NotFoundError as e:
             if e.status_code == 404 and e.error == "index_not_found_exception":
-                return []
+                return
             else:
                 raise
 
         scroll_id = data["_scroll_id"]
         hits = data.get("hits", {}).get("hits", [])
 
-        documents = [
+        while len(hits) > 0:
+            yield from hits
+
+            scroll_data = self._client.scroll(scroll_id=scroll_id, scroll="2m")
+            scroll_id = scroll_data["_scroll_id"]
+
+            hits = scroll_data.get("hits", {}).get("hits", [])
+
+    def get_all_documents(self, include_fields: List[str] = []) -> List[Document]:
+        """Get all documents from vector store."""
+        es_query = {"query": {"match_all": {}}}
+
+        if len(include_fields):
+            es_query["_source"] = include_fields
+
+        return [
             Document(
                 id_=hit["_id"],
                 metadata=hit["_source"].get("metadata", {}),
                 embedding=hit["_source"].get(self.vector_field),
                 text=hit["_source"].get(self.text_field, ""),
             )
-            for hit in hits
+            for hit in self._scroll_hits(es_query)
         ]
 
-        while len(hits) > 0:
-            scroll_data = self._client.scroll(scroll_id=scroll_id, scroll="2m")
-            scroll_id = scroll_data["_scroll_id"]
+    def get_all_document_hashes(self) -> Tuple[List[str], List[str], List[str]]:
+        """Get all document IDs, hashes and ref hashes, fetching only the hash metadata fields."""
+        es_query = {
+            "query": {"match_all": {}},
+            "_source": ["metadata.hash", "metadata.ref_doc_hash"],
+        }
 
-            hits = scroll_data.get("hits", {}).get("hits", [])
+        ids = []
+        hashes = []
+        ref_hashes = []
 
-            documents.extend(
-                [
-                    Document(
-                        id_=hit["_id"],
-                        metadata=hit["_source"].get("metadata", {}),
-                        embedding=hit["_source"].get(self.vector_field),
-                        text=hit["_source"].get(self.text_field, ""),
-                    )
-                    for hit in hits
-                ],
-            )
+        for hit in self._scroll_hits(es_query):
+            metadata = hit["_source"].get("metadata", {})
+            ids.append(hit["_id"])
+            hashes.append(metadata.get("hash"))
+            ref_hashes.append(metadata.get("ref_doc_hash"))
+
+        return ids, hashes, ref_hashes
+
+    def exists_hashes(self, hashes: List[str], parent_level: bool = False) -> Set[str]:
+        """
+        Get which of the given hashes are already stored in the Elasticsearch index.
+
+        Runs batched `terms` aggregations on the hash metadata fields, so no documents are transferred.
+
+        Args:
+            hashes (List[str]): Document hashes to look up.
+            parent_level (bool, optional): Whether to match the parent document hash (`ref_doc_hash`),
+                falling back to the document own hash when `ref_doc_hash` is missing. Defaults to `False`.
+        """
+        from elasticsearch import NotFoundError
+
+        hashes = list(set(hashes))
+        found = set()
+
+        for i in range(0, len(hashes), self.batch_size):
+            batch = hashes[i : i + self.batch_size]
+            hash_filter = {"terms": {"metadata.hash": batch}}
+            aggs = {}
+
+            if parent_level:
+                aggs["ref_doc_hash"] = {
+                    "filter": {"terms": {"metadata.ref_doc_hash": batch}},
+                    "aggs": {
+                        "values": {
+                            "terms": {
+                                "field": "metadata.ref_doc_hash",
+                                "size": len(batch),
+                            },
+                        },
+                    },
+                }
+                # Own hash only counts when `ref_doc_hash` is missing
+                hash_filter = {
+                    "bool": {
+                        "filter": [hash_filter],
+                        "must_not": [{"exists": {"field": "metadata.ref_doc_hash"}}],
+                    },
+                }
+
+            aggs["hash"] = {
+                "filter": hash_filter,
+                "aggs": {
+                    "values": {
+                        "terms": {"field": "metadata.hash", "size": len(batch)},
+                    },
+                },
+            }
+
+            try:
+                data = self._client.search(index=self.index_name, size=0, aggs=aggs)
+            except NotFoundError as e:
+                if e.status_code == 404 and e.error == "index_not_found_exception":
+                    return set()
+                else:
+                    raise
+
+            for agg in data["aggregations"].values():
+                found.update(bucket["key"] for bucket in agg["values"]["buckets"])
+
+        return found
+
+    def get_ids_by_hashes(
+        self,
+        hashes: List[str],
+        parent_level: bool = False,
+    ) -> Dict[str, List[str]]:
+        """
+        Get the IDs of the documents of the Elasticsearch index matching each of the given hashes.
+
+        Scrolls through batched `terms` queries on the hash metadata fields, fetching only those fields.
+
+        Args:
+            hashes (List[str]): Document hashes to look up.
+            parent_level (bool, optional): Whether to match the parent document hash (`ref_doc_hash`),
+                falling back to the document own hash when `ref_doc_hash` is missing. Defaults to `False`.
+        """
+        hashes = list(set(hashes))
+        ids_by_hash = {}
+
+        for i in range(0, len(hashes), self.batch_size):
+            batch = hashes[i : i + self.batch_size]
+            es_query = {
+                "query": {"terms": {"metadata.hash": batch}},
+                "_source": ["metadata.hash", "metadata.ref_doc_hash"],
+            }
+
+            if parent_level:
+                es_query["query"] = {
+                    "bool": {
+                        "should": [
+                            {"terms": {"metadata.ref_doc_hash": batch}},
+                            # Own hash only counts when `ref_doc_hash` is missing
+                            {
+                                "bool": {
+                                    "filter": [es_query["query"]],
+                                    "must_not": [
+                                        {"exists": {"field": "metadata.ref_doc_hash"}}
+                                    ],
+                                },
+                            },
+                        ],
+                    },
+                }
+
+            for hit in self._scroll_hits(es_query):
+                metadata = hit["_source"].get("metadata", {})
+                _hash = metadata.get("hash")
+
+                if parent_level and metadata.get("ref_doc_hash") is not None:
+                    _hash = metadata["ref_doc_hash"]
+
+                ids_by_hash.setdefault(_hash, []).append(hit["_id"])
 
-        return documents
+        return ids_by_hash